@@ -6,27 +6,41 @@ This script parses the Pi Zero SVG file and identifies the GPIO pin positions
 by looking for the copper-colored ellipses that represent the 40-pin header.
 """
 
+import array
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+# lxml parses through libxml2 and can filter events by tag in C; fall back to
+# the standard library when it is not installed.
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# NumPy is optional too; the pin grid summary has a pure-Python fallback.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Namespaced tag names, built once and compared against every parsed element
+SVG_NS = "http://www.w3.org/2000/svg"
+G_TAG = f"{{{SVG_NS}}}g"
+ELLIPSE_TAG = f"{{{SVG_NS}}}ellipse"
+
+# Extract matrix values: matrix(a, b, c, d, e, f)
+# Transforms point (x,y) to (ax + cy + e, bx + dy + f)
+_MATRIX_RE = re.compile(r"matrix\(([-\d.]+),([-\d.]+),([-\d.]+),([-\d.]+),([-\d.]+),([-\d.]+)\)")
+
 
 def parse_transform(transform_str):
     """Parse SVG transform matrix and return matrix components."""
     if not transform_str or "matrix" not in transform_str:
         return None
 
-    # Extract matrix values: matrix(a, b, c, d, e, f)
-    # Transforms point (x,y) to (ax + cy + e, bx + dy + f)
-    import re
-
-    match = re.search(
-        r"matrix\(([-\d.]+),([-\d.]+),([-\d.]+),([-\d.]+),([-\d.]+),([-\d.]+)\)",
-        transform_str,
-    )
-    if match:
-        a, b, c, d, e, f = map(float, match.groups())
-        return (a, b, c, d, e, f)
-    return None
+    match = _MATRIX_RE.search(transform_str)
+    return tuple(map(float, match.groups())) if match else None
 
 
 def apply_transform(cx, cy, matrix):
@@ -39,6 +53,92 @@ def apply_transform(cx, cy, matrix):
     return x, y
 
 
+def _collect_group_ellipses_lxml(svg_path):
+    """Collect group ellipses with lxml, letting libxml2 skip non-ellipse events."""
+    ellipses = []
+    context = lxml_etree.iterparse(
+        str(svg_path), events=("end",), tag=ELLIPSE_TAG, huge_tree=False, collect_ids=False
+    )
+    for _, elem in context:
+        parent = elem.getparent()
+        if parent is not None and parent.tag == G_TAG:
+            matrix = parse_transform(parent.get("transform", ""))
+            cx = float(elem.get("cx", 0))
+            cy = float(elem.get("cy", 0))
+            ellipses.append((cx, cy, elem.get("style", ""), matrix))
+        elem.clear()
+    return context.root.get("viewBox"), ellipses
+
+
+def _collect_group_ellipses_stdlib(svg_path):
+    """Collect group ellipses with xml.etree in a single streaming pass."""
+    # Each open element pushes (tag, transform matrix) so an ellipse can pick up
+    # the transform of its parent group.
+    ellipses = []
+    viewbox = None
+    open_elements = []
+    for event, elem in ET.iterparse(svg_path, events=("start", "end")):
+        if event == "start":
+            if viewbox is None and not open_elements:
+                viewbox = elem.get("viewBox")
+            matrix = None
+            if elem.tag == G_TAG:
+                matrix = parse_transform(elem.get("transform", ""))
+            open_elements.append((elem.tag, matrix))
+            continue
+
+        open_elements.pop()
+        if elem.tag == ELLIPSE_TAG and open_elements:
+            parent_tag, matrix = open_elements[-1]
+            if parent_tag == G_TAG:
+                cx = float(elem.get("cx", 0))
+                cy = float(elem.get("cy", 0))
+                ellipses.append((cx, cy, elem.get("style", ""), matrix))
+
+        # Free the element once inspected; the root keeps its (now empty) children
+        elem.clear()
+    return viewbox, ellipses
+
+
+def collect_group_ellipses(svg_path):
+    """
+    Return the SVG viewBox and every ellipse that is a direct child of a group.
+
+    Each ellipse is returned as (cx, cy, style, matrix), where matrix is the
+    parsed transform of its parent group (or None).
+    """
+    if lxml_etree is not None:
+        return _collect_group_ellipses_lxml(svg_path)
+    return _collect_group_ellipses_stdlib(svg_path)
+
+
+def summarize_pin_grid(xs, ys):
+    """
+    Sort pin positions and find the distinct columns and rows.
+
+    Takes the pin coordinates as two parallel sequences (e.g. array.array("d")).
+    Returns (sorted_points, x_positions, y_positions): the (x, y) points ordered
+    by Y then X, and the sorted unique X and Y coordinates rounded to 0.1.
+    """
+    if np is not None:
+        # array.array exposes the buffer protocol, so these are zero-copy views
+        x_arr = np.asarray(xs, dtype=np.float64)
+        y_arr = np.asarray(ys, dtype=np.float64)
+        order = np.lexsort((x_arr, y_arr))
+        x_positions = np.unique(np.round(x_arr, 1))
+        y_positions = np.unique(np.round(y_arr, 1))
+        return (
+            list(zip(x_arr[order].tolist(), y_arr[order].tolist(), strict=True)),
+            x_positions.tolist(),
+            y_positions.tolist(),
+        )
+
+    sorted_points = sorted(zip(xs, ys, strict=True), key=lambda p: (p[1], p[0]))
+    x_positions = sorted({round(x, 1) for x in xs})
+    y_positions = sorted({round(y, 1) for y in ys})
+    return sorted_points, x_positions, y_positions
+
+
 def analyze_svg():
     """Analyze the Pi Zero SVG and extract GPIO pin positions."""
     # Path to the Pi Zero SVG
@@ -51,57 +151,44 @@ def analyze_svg():
     print(f"📂 Analyzing: {svg_path}")
     print()
 
-    # Parse SVG
-    tree = ET.parse(svg_path)
-    root = tree.getroot()
-
-    # Find viewBox
-    viewbox = root.get("viewBox")
-    print(f"📐 ViewBox: {viewbox}")
-    print()
-
-    # Find all ellipses (GPIO pins are ellipses)
-    ellipses = []
+    # Find all ellipses (GPIO pins are ellipses); coordinates are kept as two
+    # parallel float arrays rather than a list of tuples
+    xs = array.array("d")
+    ys = array.array("d")
+    # Every ellipse inside a group, kept for the fallback listing below
+    all_ellipses = []
 
     # Look for ellipses with copper color stroke (GPIO pins)
     copper_color = "rgb(170,137,100)"
 
-    for g in root.iter("{http://www.w3.org/2000/svg}g"):
-        # Get transform from parent group
-        transform = g.get("transform", "")
-        matrix = parse_transform(transform)
+    viewbox, group_ellipses = collect_group_ellipses(svg_path)
+    for cx, cy, style, matrix in group_ellipses:
+        # Apply transform
+        final_x, final_y = apply_transform(cx, cy, matrix)
+        all_ellipses.append((final_x, final_y, style))
 
-        for ellipse in g.findall("{http://www.w3.org/2000/svg}ellipse"):
-            style = ellipse.get("style", "")
-            cx = float(ellipse.get("cx", 0))
-            cy = float(ellipse.get("cy", 0))
+        # Check if this is a GPIO pin (copper colored)
+        if copper_color in style:
+            xs.append(final_x)
+            ys.append(final_y)
 
-            # Check if this is a GPIO pin (copper colored)
-            if copper_color in style:
-                # Apply transform
-                final_x, final_y = apply_transform(cx, cy, matrix)
-                ellipses.append((final_x, final_y))
+    # Find viewBox
+    print(f"📐 ViewBox: {viewbox}")
+    print()
 
-    print(f"🔍 Found {len(ellipses)} GPIO pin ellipses")
+    print(f"🔍 Found {len(xs)} GPIO pin ellipses")
     print()
 
-    if not ellipses:
+    if not xs:
         print("⚠️  No GPIO pins found. Analyzing all ellipses...")
         # Fallback: show all ellipses
-        for g in root.iter("{http://www.w3.org/2000/svg}g"):
-            transform = g.get("transform", "")
-            matrix = parse_transform(transform)
-
-            for ellipse in g.findall("{http://www.w3.org/2000/svg}ellipse"):
-                cx = float(ellipse.get("cx", 0))
-                cy = float(ellipse.get("cy", 0))
-                final_x, final_y = apply_transform(cx, cy, matrix)
-                style = ellipse.get("style", "")[:100]
-                print(f"  Ellipse at ({final_x:.2f}, {final_y:.2f}) - style: {style}...")
+        for final_x, final_y, style in all_ellipses:
+            print(f"  Ellipse at ({final_x:.2f}, {final_y:.2f}) - style: {style[:100]}...")
         return
 
-    # Sort by Y position first, then X (to identify rows and columns)
-    sorted_by_y = sorted(ellipses, key=lambda p: (p[1], p[0]))
+    # Sort by Y position first, then X (to identify rows and columns), and find
+    # the unique X positions (should be 2 columns) and Y positions (should be 20 rows)
+    sorted_by_y, x_positions, y_positions = summarize_pin_grid(xs, ys)
 
     print("📍 GPIO Pin Positions (sorted by Y, then X):")
     print()
@@ -114,12 +201,7 @@ def analyze_svg():
     print("📊 Analysis:")
     print()
 
-    # Find unique X positions (should be 2 columns)
-    x_positions = sorted({round(x, 1) for x, y in ellipses})
     print(f"  Column X positions: {x_positions}")
-
-    # Find unique Y positions (should be 20 rows)
-    y_positions = sorted({round(y, 1) for x, y in ellipses})
     print(f"  Row Y positions ({len(y_positions)} rows)")
 
     if len(y_positions) >= 2:
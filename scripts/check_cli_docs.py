@@ -18,13 +18,19 @@ Exit codes:
 from __future__ import annotations
 
 import re
-import subprocess
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import typer
+    from typer.testing import CliRunner
 
 # Options present on every command — intentionally not re-documented per command
 SKIP_OPTIONS = {"--help"}
 
+OPTION_RE = re.compile(r"--[\w-]+")
+
 # (human-readable label, pinviz subcommand args to produce --help)
 COMMANDS: list[tuple[str, list[str]]] = [
     ("render", ["render", "--help"]),
@@ -36,19 +42,16 @@ COMMANDS: list[tuple[str, list[str]]] = [
 ]
 
 
-def run_help(args: list[str]) -> str:
-    """Run pinviz with the given args and return combined stdout+stderr."""
-    result = subprocess.run(
-        ["pinviz", *args],
-        capture_output=True,
-        text=True,
-    )
-    return result.stdout + result.stderr
+def run_help(runner: CliRunner, app: typer.Typer, args: list[str]) -> str:
+    """Invoke the pinviz app in-process with the given args and return its output."""
+    # A wide terminal keeps rich from truncating long option names
+    result = runner.invoke(app, args, env={"COLUMNS": "200"})
+    return result.output
 
 
 def extract_options(help_text: str) -> set[str]:
     """Return all --option-name tokens from help text, excluding SKIP_OPTIONS."""
-    found = set(re.findall(r"--[\w-]+", help_text))
+    found = set(OPTION_RE.findall(help_text))
     return found - SKIP_OPTIONS
 
 
@@ -62,20 +65,26 @@ def main() -> int:
 
     docs_text = docs_path.read_text()
 
-    # Verify pinviz is available
-    probe = subprocess.run(["pinviz", "--version"], capture_output=True, text=True)
-    if probe.returncode not in (0, 1):
+    # Verify pinviz is available; commands are invoked in-process rather than
+    # spawning a fresh interpreter per --help call
+    try:
+        from typer.testing import CliRunner
+
+        from pinviz.cli import app
+    except ImportError:
         print(
-            "ERROR: could not run 'pinviz'. Make sure pinviz is installed "
+            "ERROR: could not import 'pinviz'. Make sure pinviz is installed "
             "in the current environment (uv sync --dev).",
             file=sys.stderr,
         )
         return 2
 
+    runner = CliRunner()
+
     drift: list[tuple[str, list[str]]] = []
 
     for label, args in COMMANDS:
-        help_text = run_help(args)
+        help_text = run_help(runner, app, args)
         options = extract_options(help_text)
 
         if verbose:
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+render_all_examples.py — Run every Python API example in parallel.
+
+Each examples/*_python.py script builds a diagram and renders it into out/.
+The examples are independent, so they are executed in a process pool rather
+than one after another.
+
+Usage:
+    python scripts/render_all_examples.py
+    python scripts/render_all_examples.py --verbose
+
+Exit codes:
+    0  All examples rendered
+    1  One or more examples failed
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import runpy
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+EXAMPLES_DIR = REPO_ROOT / "examples"
+OUTPUT_DIR = REPO_ROOT / "out"
+
+
+def run_example(path: str) -> tuple[str, str, str | None]:
+    """Execute one example script and return (name, captured output, error)."""
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            runpy.run_path(path, run_name="__main__")
+    except Exception:
+        return Path(path).name, output.getvalue(), traceback.format_exc()
+    return Path(path).name, output.getvalue(), None
+
+
+def main() -> int:
+    verbose = "--verbose" in sys.argv or "-v" in sys.argv
+
+    examples = sorted(str(path) for path in EXAMPLES_DIR.glob("*_python.py"))
+    if not examples:
+        print("No examples found.")
+        return 0
+
+    # Examples write to paths relative to the repository root (out/...)
+    os.chdir(REPO_ROOT)
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    workers = min(len(examples), os.cpu_count() or 1)
+    # Batch tasks per worker round-trip once there are more examples than workers
+    chunksize = max(1, len(examples) // (workers * 4))
+
+    failures: list[tuple[str, str]] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for name, output, error in executor.map(run_example, examples, chunksize=chunksize):
+            if error is None:
+                print(f"  ✓ {name}")
+                if verbose and output:
+                    print(output.rstrip())
+            else:
+                print(f"  ✗ {name}")
+                failures.append((name, error))
+
+    if failures:
+        print(f"\n{len(failures)} of {len(examples)} example(s) failed:\n")
+        for name, error in failures:
+            print(f"--- {name}")
+            print(error)
+        return 1
+
+    print(f"\nOK — rendered {len(examples)} example(s) into {OUTPUT_DIR.relative_to(REPO_ROOT)}/.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,34 @@
 #!/usr/bin/env python3
 """Update CHANGELOG.md with GitHub release notes."""
 
+import os
 import re
+import shutil
 import sys
+import tempfile
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+# One bulleted PR per line; [ \t] rather than \s keeps each match on a single line.
+# The user and link are single tokens (\S+), so only the title span can backtrack.
+PR_LINE_RE = re.compile(
+    r"^[ \t]*\*[ \t]+(.+?)[ \t]+by[ \t]+@\S+[ \t]+in[ \t]+(https://\S+)[ \t\r]*$", re.MULTILINE
+)
+UNRELEASED_RE = re.compile(r"## \[Unreleased\]")
+LINKS_RE = re.compile(
+    r"(\[Unreleased\]: https://github\.com/[^/]+/[^/]+/compare/)v[\d.]+\.\.\.HEAD"
+)
+PREV_VERSION_RE = re.compile(r"## \[(\d+\.\d+\.\d+)\]")
+
+# Checked in order against the lowercased PR title; anything unmatched is "Changed"
+CATEGORY_RES = [
+    ("Dependencies", re.compile(r"^bump ")),
+    ("Added", re.compile(r"add|new|implement|introduce|create")),
+    ("Fixed", re.compile(r"fix|resolve|correct|repair|patch")),
+    ("Removed", re.compile(r"remove|delete|drop")),
+]
+
 
 def parse_github_release_notes(notes: str) -> dict[str, list[str]]:
     """
@@ -25,38 +48,17 @@ def parse_github_release_notes(notes: str) -> dict[str, list[str]]:
         "Dependencies": [],
     }
 
-    # Split into lines and process each PR
-    for line in notes.split("\n"):
-        line = line.strip()
-        if not line.startswith("*"):
-            continue
-
-        # Extract PR title and link
-        # Format: * PR title by @user in #123
-        match = re.match(r"\*\s+(.+?)\s+by\s+@.+?\s+in\s+(https://.+)$", line)
-        if not match:
-            continue
-
-        title = match.group(1)
-        pr_link = match.group(2)
+    # Extract PR title and link from each bulleted line
+    # Format: * PR title by @user in https://github.com/.../pull/123
+    for match in PR_LINE_RE.finditer(notes):
+        title, pr_link = match.groups()
 
         # Categorize based on PR title
         title_lower = title.lower()
-
-        if title_lower.startswith("bump "):
-            # Dependency update
-            categories["Dependencies"].append(f"- {title} ({pr_link})")
-        elif any(
-            word in title_lower for word in ["add", "new", "implement", "introduce", "create"]
-        ):
-            categories["Added"].append(f"- {title} ({pr_link})")
-        elif any(word in title_lower for word in ["fix", "resolve", "correct", "repair", "patch"]):
-            categories["Fixed"].append(f"- {title} ({pr_link})")
-        elif any(word in title_lower for word in ["remove", "delete", "drop"]):
-            categories["Removed"].append(f"- {title} ({pr_link})")
-        else:
-            # Default to Changed
-            categories["Changed"].append(f"- {title} ({pr_link})")
+        category = next(
+            (name for name, pattern in CATEGORY_RES if pattern.search(title_lower)), "Changed"
+        )
+        categories[category].append(f"- {title} ({pr_link})")
 
     return categories
 
@@ -110,8 +112,7 @@ def update_changelog(
     content = changelog_path.read_text()
 
     # Find the ## [Unreleased] section
-    unreleased_pattern = r"## \[Unreleased\]"
-    match = re.search(unreleased_pattern, content)
+    match = UNRELEASED_RE.search(content)
 
     if not match:
         raise ValueError("Could not find [Unreleased] section in CHANGELOG.md")
@@ -129,16 +130,20 @@ def update_changelog(
 
     # Update the version comparison links at the bottom
     # Add new link for this version
-    links_pattern = r"(\[Unreleased\]: https://github\.com/[^/]+/[^/]+/compare/)v[\d.]+\.\.\.HEAD"
-    match = re.search(links_pattern, updated_content)
+    match = LINKS_RE.search(updated_content)
 
     if match:
-        # Update Unreleased link to compare from new version
-        updated_content = re.sub(links_pattern, rf"\g<1>v{version}...HEAD", updated_content)
-
-        # Find previous version from the changelog
-        prev_version_pattern = r"## \[(\d+\.\d+\.\d+)\]"
-        versions = re.findall(prev_version_pattern, updated_content)
+        # Update Unreleased link to compare from new version, splicing at the
+        # match instead of rescanning the whole changelog with re.sub
+        unreleased_link = f"{match.group(1)}v{version}...HEAD"
+        unreleased_link_end = match.start() + len(unreleased_link)
+        updated_content = (
+            updated_content[: match.start()] + unreleased_link + updated_content[match.end() :]
+        )
+
+        # Find previous version from the changelog; only the first two headings
+        # matter, so stop scanning once they are found
+        versions = [m.group(1) for m in islice(PREV_VERSION_RE.finditer(updated_content), 2)]
 
         # versions[0] is the new version we just added
         # versions[1] is the previous version
@@ -150,15 +155,19 @@ def update_changelog(
                 f"v{prev_version}...v{version}"
             )
             # Insert after Unreleased link
-            unreleased_link_end = updated_content.find("\n", match.end())
+            line_end = updated_content.find("\n", unreleased_link_end)
             updated_content = (
-                updated_content[:unreleased_link_end]
-                + f"\n{new_version_link}"
-                + updated_content[unreleased_link_end:]
+                updated_content[:line_end] + f"\n{new_version_link}" + updated_content[line_end:]
             )
 
-    # Write updated content
-    changelog_path.write_text(updated_content)
+    # Write to a sibling temp file and swap it in, so an interrupted run never
+    # leaves a truncated CHANGELOG.md behind
+    with tempfile.NamedTemporaryFile(
+        "w", dir=changelog_path.parent, prefix=f".{changelog_path.name}.", delete=False
+    ) as tmp:
+        tmp.write(updated_content)
+    shutil.copymode(changelog_path, tmp.name)
+    os.replace(tmp.name, changelog_path)
 
 
 def main():
@@ -1,6 +1,8 @@
 """PinViz - Generate Raspberry Pi GPIO connection diagrams."""
 
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
 import structlog
 
@@ -13,32 +15,76 @@ structlog.configure(
     cache_logger_on_first_use=False,
 )
 
-from . import boards, devices  # noqa: E402
-from .config_loader import load_diagram  # noqa: E402
-from .model import (  # noqa: E402
-    Board,
-    Component,
-    ComponentType,
-    Connection,
-    Device,
-    DevicePin,
-    Diagram,
-    HeaderPin,
-    PinRole,
-    Point,
-    WireColor,
-    WireStyle,
-)
-from .render_svg import SVGRenderer  # noqa: E402
-from .validation import DiagramValidator, ValidationIssue, ValidationLevel  # noqa: E402
+if TYPE_CHECKING:
+    from . import boards, devices
+    from .config_loader import load_diagram, load_diagram_from_dict, load_diagrams
+    from .model import (
+        Board,
+        Component,
+        ComponentType,
+        Connection,
+        Device,
+        DevicePin,
+        Diagram,
+        HeaderPin,
+        PinRole,
+        Point,
+        WireColor,
+        WireStyle,
+    )
+    from .render_svg import SVGRenderer
+    from .validation import DiagramValidator, ValidationIssue, ValidationLevel
+
+# Public names are imported on first access (PEP 562), so `import pinviz` does not
+# pull in the renderer, validator and board configs until they are actually used.
+_LAZY_IMPORTS = {
+    "boards": ".boards",
+    "devices": ".devices",
+    "load_diagram": ".config_loader",
+    "load_diagram_from_dict": ".config_loader",
+    "load_diagrams": ".config_loader",
+    "Board": ".model",
+    "Component": ".model",
+    "ComponentType": ".model",
+    "Connection": ".model",
+    "Device": ".model",
+    "DevicePin": ".model",
+    "Diagram": ".model",
+    "HeaderPin": ".model",
+    "PinRole": ".model",
+    "Point": ".model",
+    "WireColor": ".model",
+    "WireStyle": ".model",
+    "SVGRenderer": ".render_svg",
+    "DiagramValidator": ".validation",
+    "ValidationIssue": ".validation",
+    "ValidationLevel": ".validation",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import public names on first access and resolve __version__ from metadata."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        # Submodules (boards, devices) are exported as themselves
+        value = module if module.__name__ == f"{__name__}.{name}" else getattr(module, name)
+    elif name == "__version__":
+        try:
+            from importlib.metadata import version
+
+            value = version("pinviz")
+        except Exception:
+            value = "unknown"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
-# Get version from package metadata
-try:
-    from importlib.metadata import version
+def __dir__() -> list[str]:
+    """Include the lazily imported public names in dir(pinviz)."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-    __version__ = version("pinviz")
-except Exception:
-    __version__ = "unknown"
 
 __all__ = [
     # Core models
@@ -59,6 +105,8 @@ __all__ = [
     "devices",
     # Functions
     "load_diagram",
+    "load_diagram_from_dict",
+    "load_diagrams",
     # Renderer
     "SVGRenderer",
     # Validation
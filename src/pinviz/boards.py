@@ -1,13 +1,22 @@
 """Predefined Raspberry Pi board templates."""
 
 import json
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from .board_renderer import BoardLayout
 from .model import Board, HeaderPin, PinRole, Point
-from .schemas import BoardConfigSchema, validate_board_config
+from .schemas import BoardConfigSchema
+
+_MODULE_DIR = Path(__file__).parent
+_ASSETS_DIR = _MODULE_DIR / "assets"
+_BOARD_CONFIGS_DIR = _MODULE_DIR / "board_configs"
 
 
+@cache
 def _get_asset_path(filename: str) -> str:
     """
     Get the absolute path to an asset file.
@@ -24,11 +33,10 @@ def _get_asset_path(filename: str) -> str:
     Note:
         This is an internal function. Users typically don't need to call this directly.
     """
-    module_dir = Path(__file__).parent
-    asset_path = module_dir / "assets" / filename
-    return str(asset_path)
+    return str(_ASSETS_DIR / filename)
 
 
+@cache
 def _get_board_config_path(config_name: str) -> Path:
     """
     Get the path to a board configuration file.
@@ -42,9 +50,7 @@ def _get_board_config_path(config_name: str) -> Path:
     Note:
         This is an internal function. Users typically don't need to call this directly.
     """
-    module_dir = Path(__file__).parent
-    config_path = module_dir / "board_configs" / f"{config_name}.json"
-    return config_path
+    return _BOARD_CONFIGS_DIR / f"{config_name}.json"
 
 
 def _calculate_dual_header_positions(layout_dict: dict, pins: list) -> dict[int, Point]:
@@ -128,57 +134,41 @@ def _calculate_single_header_positions(layout_dict: dict, pins: list) -> dict[in
     """
     pin_positions = {}
     num_rows = len(pins) // 2  # 20 rows for 40-pin header
+    left_x = layout_dict["left_col_x"]
+    right_x = layout_dict["right_col_x"]
+    start_y = layout_dict["start_y"]
+    row_spacing = layout_dict["row_spacing"]
 
-    for row in range(num_rows):
-        y_pos = layout_dict["start_y"] + (row * layout_dict["row_spacing"])
-        odd_pin = (row * 2) + 1  # Physical pins 1, 3, 5, ...
-        even_pin = (row * 2) + 2  # Physical pins 2, 4, 6, ...
-
-        pin_positions[odd_pin] = Point(layout_dict["left_col_x"], y_pos)  # Left column
-        pin_positions[even_pin] = Point(layout_dict["right_col_x"], y_pos)  # Right column
+    # Odd pins (1, 3, 5, ...) sit in the left column, even pins in the right
+    for row, odd_pin in enumerate(range(1, 2 * num_rows, 2)):
+        y_pos = start_y + row * row_spacing
+        pin_positions[odd_pin] = Point(left_x, y_pos)
+        pin_positions[odd_pin + 1] = Point(right_x, y_pos)
 
     return pin_positions
 
 
-def load_board_from_config(config_name: str) -> Board:
+@cache
+def _load_board_config(config_name: str) -> BoardConfigSchema:
     """
-    Load a board definition from a JSON configuration file.
-
-    This function reads a board configuration from the board_configs directory,
-    validates it against the BoardConfigSchema, calculates pin positions based
-    on layout parameters, and returns a fully configured Board object.
+    Read and validate a board configuration file.
 
-    The configuration file must specify:
-    - Board metadata (name, SVG asset, dimensions)
-    - GPIO header layout parameters (column positions, spacing)
-    - Pin definitions (physical pin number, name, role, BCM GPIO number)
-
-    Pin positions are calculated automatically based on the layout parameters
-    to align with the board's SVG asset.
+    Board configs are bundled with the package and never change at runtime, so
+    the validated schema is cached per config name. Callers get a fresh Board
+    built from it on every call and remain free to mutate that Board.
 
     Args:
-        config_name: Name of the board configuration file (without .json extension)
-                    For example, "raspberry_pi_5" will load "raspberry_pi_5.json"
+        config_name: Name of the board configuration (e.g., "raspberry_pi_5")
 
     Returns:
-        Board: Configured board with all pins positioned
+        Validated board configuration
 
     Raises:
         FileNotFoundError: If the configuration file doesn't exist
         ValueError: If the configuration is invalid or fails validation
-        json.JSONDecodeError: If the JSON file is malformed
-
-    Examples:
-        >>> board = load_board_from_config("raspberry_pi_5")
-        >>> print(board.name)
-        Raspberry Pi 5
-        >>> print(len(board.pins))
-        40
 
     Note:
-        This is the recommended way to add new board types. Simply create a new
-        JSON configuration file in the board_configs directory following the
-        schema defined in BoardConfigSchema.
+        This is an internal function used by load_board_from_config().
     """
     config_path = _get_board_config_path(config_name)
 
@@ -188,24 +178,66 @@ def load_board_from_config(config_name: str) -> Board:
             f"Available configurations should be placed in the board_configs directory."
         )
 
+    # Parse and validate in one pass with pydantic-core's JSON parser instead of
+    # building an intermediate dict with json.load
     try:
-        with open(config_path) as f:
-            config_dict = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in board configuration file {config_path}: {e}") from e
-
-    # Validate configuration against schema
-    try:
-        config: BoardConfigSchema = validate_board_config(config_dict)
-    except Exception as e:
+        config = BoardConfigSchema.model_validate_json(config_path.read_bytes())
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise ValueError(f"Invalid JSON in board configuration file {config_path}: {e}") from e
         raise ValueError(f"Invalid board configuration in {config_path}: {e}") from e
 
-    # Calculate pin positions based on layout parameters
-    # Check if this is a dual-header board (like Pico) or single-header (like Pi 5)
+    return config
+
+
+def _get_layout_dict(config: BoardConfigSchema) -> tuple[dict, bool]:
+    """
+    Return a board config's layout as a dict and whether it is dual-header.
+
+    Dual-header boards (like Pico) define top_header and bottom_header;
+    single-header boards (like Pi 5) use the two-column layout keys.
+
+    Note:
+        This is an internal function used by load_board_from_config().
+    """
     layout_dict = config.layout if isinstance(config.layout, dict) else config.layout.__dict__
     is_dual_header = (
         layout_dict.get("top_header") is not None and layout_dict.get("bottom_header") is not None
     )
+    return layout_dict, is_dual_header
+
+
+def _is_svg_asset_mode(config: BoardConfigSchema) -> bool:
+    """Whether a board config renders its embedded SVG asset instead of a BoardLayout."""
+    return getattr(config, "render_mode", "programmatic") == "svg_asset"
+
+
+@cache
+def _load_header_pin_specs(
+    config_name: str,
+) -> tuple[tuple[int, str, PinRole, int | None, Point], ...]:
+    """
+    Compute the header pins of a board configuration.
+
+    Positions, roles and ordering depend only on the (cached) config, so they
+    are computed once per config name. Each entry holds the HeaderPin fields
+    (number, name, role, gpio_bcm, position) in order; load_board_from_config()
+    builds fresh HeaderPin objects from them so callers can mutate their Board.
+
+    Args:
+        config_name: Name of the board configuration (e.g., "raspberry_pi_5")
+
+    Returns:
+        Pin field tuples sorted by physical pin number
+
+    Raises:
+        ValueError: If a pin's position cannot be calculated from the layout
+
+    Note:
+        This is an internal function used by load_board_from_config().
+    """
+    config = _load_board_config(config_name)
+    layout_dict, is_dual_header = _get_layout_dict(config)
 
     # Use appropriate position calculation method based on board type
     if is_dual_header:
@@ -213,10 +245,12 @@ def load_board_from_config(config_name: str) -> Board:
     else:
         pin_positions = _calculate_single_header_positions(layout_dict, config.pins)
 
-    # Create HeaderPin objects from configuration
-    pins = []
-    for pin_config in config.pins:
-        pin_role = PinRole(pin_config.role)  # Convert string to PinRole enum
+    # Scale pin positions to match SVG scaling in svg_asset render mode
+    svg_scale = getattr(config, "svg_scale", 1.0) if _is_svg_asset_mode(config) else 1.0
+
+    # Sort by physical pin number for consistency
+    specs = []
+    for pin_config in sorted(config.pins, key=attrgetter("physical_pin")):
         position = pin_positions.get(pin_config.physical_pin)
 
         if position is None:
@@ -224,29 +258,71 @@ def load_board_from_config(config_name: str) -> Board:
                 f"Could not calculate position for pin {pin_config.physical_pin}. "
                 f"Pin number may be out of range for the configured layout."
             )
-
-        header_pin = HeaderPin(
-            number=pin_config.physical_pin,
-            name=pin_config.name,
-            role=pin_role,
-            gpio_bcm=pin_config.gpio_bcm,
-            position=position,
+        if svg_scale != 1.0:
+            position = Point(position.x * svg_scale, position.y * svg_scale)
+
+        specs.append(
+            (
+                pin_config.physical_pin,
+                pin_config.name,
+                PinRole(pin_config.role),  # Convert string to PinRole enum
+                pin_config.gpio_bcm,
+                position,
+            )
         )
-        pins.append(header_pin)
 
-    # Sort pins by physical pin number for consistency
-    pins.sort(key=lambda p: p.number)
+    return tuple(specs)
+
+
+def load_board_from_config(config_name: str) -> Board:
+    """
+    Load a board definition from a JSON configuration file.
+
+    This function reads a board configuration from the board_configs directory,
+    validates it against the BoardConfigSchema, calculates pin positions based
+    on layout parameters, and returns a fully configured Board object.
+
+    The configuration file must specify:
+    - Board metadata (name, SVG asset, dimensions)
+    - GPIO header layout parameters (column positions, spacing)
+    - Pin definitions (physical pin number, name, role, BCM GPIO number)
+
+    Pin positions are calculated automatically based on the layout parameters
+    to align with the board's SVG asset.
+
+    Args:
+        config_name: Name of the board configuration file (without .json extension)
+                    For example, "raspberry_pi_5" will load "raspberry_pi_5.json"
+
+    Returns:
+        Board: Configured board with all pins positioned
+
+    Raises:
+        FileNotFoundError: If the configuration file doesn't exist
+        ValueError: If the configuration is invalid or fails validation
+        json.JSONDecodeError: If the JSON file is malformed
+
+    Examples:
+        >>> board = load_board_from_config("raspberry_pi_5")
+        >>> print(board.name)
+        Raspberry Pi 5
+        >>> print(len(board.pins))
+        40
+
+    Note:
+        This is the recommended way to add new board types. Simply create a new
+        JSON configuration file in the board_configs directory following the
+        schema defined in BoardConfigSchema.
+    """
+    config = _load_board_config(config_name)
+
+    layout_dict, is_dual_header = _get_layout_dict(config)
+    pins = [HeaderPin(*spec) for spec in _load_header_pin_specs(config_name)]
 
     # Check render mode: svg_asset mode skips BoardLayout so the legacy SVG
     # embedding path is used (board.layout == None triggers SVG asset rendering).
-    render_mode = getattr(config, "render_mode", "programmatic")
-    if render_mode == "svg_asset":
+    if _is_svg_asset_mode(config):
         svg_scale = getattr(config, "svg_scale", 1.0)
-        # Scale pin positions to match SVG scaling
-        if svg_scale != 1.0:
-            for pin in pins:
-                if pin.position:
-                    pin.position = Point(pin.position.x * svg_scale, pin.position.y * svg_scale)
         return Board(
             name=config.name,
             pins=pins,
@@ -571,11 +647,9 @@ def get_available_boards() -> list[dict[str, str | list[str]]]:
     }
 
     boards_list = []
-    module_dir = Path(__file__).parent
-    config_dir = module_dir / "board_configs"
 
-    if config_dir.exists():
-        for config_file in sorted(config_dir.glob("*.json")):
+    if _BOARD_CONFIGS_DIR.exists():
+        for config_file in sorted(_BOARD_CONFIGS_DIR.glob("*.json")):
             board_name = config_file.stem  # e.g., "raspberry_pi_5"
 
             # Load the config to get the display name
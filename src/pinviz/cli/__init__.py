@@ -28,12 +28,8 @@ app = typer.Typer(
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
-        from importlib.metadata import version as get_version
+        from .. import __version__
 
-        try:
-            __version__ = get_version("pinviz")
-        except Exception:
-            __version__ = "unknown"
         rprint(f"pinviz version {__version__}")
         raise typer.Exit()
 
@@ -4,7 +4,6 @@ import asyncio
 
 import typer
 
-from ...device_wizard import main as wizard_main
 from ..context import AppContext
 from ..output import print_error
 
@@ -21,6 +20,10 @@ def add_device_command() -> None:
 
       pinviz add-device
     """
+    # The wizard pulls in questionary/prompt_toolkit, which dominate CLI startup
+    # time, so it is only imported when this command actually runs
+    from ...device_wizard import main as wizard_main
+
     ctx = AppContext()
     log = ctx.logger
 
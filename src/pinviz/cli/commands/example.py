@@ -6,12 +6,10 @@ from typing import Annotated
 
 import typer
 
-from ... import boards
 from ...devices import get_registry
 from ...model import Connection, Diagram
-from ...render_svg import SVGRenderer
 from ...theme import Theme
-from ...validation import DiagramValidator, ValidationLevel
+from ...validation import DiagramValidator, partition_issues
 from ..context import AppContext
 from ..decorators import handle_command_exception, progress_indicator
 from ..output import (
@@ -24,50 +22,77 @@ from ..output import (
 )
 from ..types import JsonOption, NoBoardNameOption, NoTitleOption, OutputOption, ShowLegendOption
 
+# Connections are immutable, so each example's wiring is built once at import
+_BH1750_CONNECTIONS = (
+    Connection(1, "BH1750 Light Sensor", "VCC"),  # 3V3 to VCC
+    Connection(6, "BH1750 Light Sensor", "GND"),  # GND to GND
+    Connection(5, "BH1750 Light Sensor", "SCL"),  # GPIO3/SCL to SCL
+    Connection(3, "BH1750 Light Sensor", "SDA"),  # GPIO2/SDA to SDA
+)
+
 
 def create_bh1750_example() -> Diagram:
     """Create BH1750 example diagram."""
+    from ... import boards
+
     board = boards.raspberry_pi_5()
     registry = get_registry()
     sensor = registry.create("bh1750")
 
-    connections = [
-        Connection(1, "BH1750 Light Sensor", "VCC"),  # 3V3 to VCC
-        Connection(6, "BH1750 Light Sensor", "GND"),  # GND to GND
-        Connection(5, "BH1750 Light Sensor", "SCL"),  # GPIO3/SCL to SCL
-        Connection(3, "BH1750 Light Sensor", "SDA"),  # GPIO2/SDA to SDA
-    ]
-
     return Diagram(
         title="BH1750 Light Sensor Wiring",
         board=board,
         devices=[sensor],
-        connections=connections,
+        connections=list(_BH1750_CONNECTIONS),
     )
 
 
+_IR_LED_CONNECTIONS = (
+    Connection(2, "IR LED Ring (12)", "VCC"),  # 5V to VCC
+    Connection(6, "IR LED Ring (12)", "GND"),  # GND to GND
+    Connection(7, "IR LED Ring (12)", "EN"),  # GPIO4 to EN
+)
+
+
 def create_ir_led_example() -> Diagram:
     """Create IR LED ring example diagram."""
+    from ... import boards
+
     board = boards.raspberry_pi_5()
     registry = get_registry()
     ir_led = registry.create("ir_led_ring", num_leds=12)
 
-    connections = [
-        Connection(2, "IR LED Ring (12)", "VCC"),  # 5V to VCC
-        Connection(6, "IR LED Ring (12)", "GND"),  # GND to GND
-        Connection(7, "IR LED Ring (12)", "EN"),  # GPIO4 to EN
-    ]
-
     return Diagram(
         title="IR LED Ring Wiring",
         board=board,
         devices=[ir_led],
-        connections=connections,
+        connections=list(_IR_LED_CONNECTIONS),
     )
 
 
+_I2C_SPI_CONNECTIONS = (
+    # BH1750 I2C sensor
+    Connection(1, "BH1750 Light Sensor", "VCC"),
+    Connection(9, "BH1750 Light Sensor", "GND"),
+    Connection(5, "BH1750 Light Sensor", "SCL"),
+    Connection(3, "BH1750 Light Sensor", "SDA"),
+    # SPI OLED display
+    Connection(17, "OLED Display", "VCC"),
+    Connection(20, "OLED Display", "GND"),
+    Connection(23, "OLED Display", "SCLK"),
+    Connection(19, "OLED Display", "MOSI"),
+    Connection(21, "OLED Display", "MISO"),
+    Connection(24, "OLED Display", "CS"),
+    # Simple LED
+    Connection(11, "Red LED", "+"),  # GPIO17
+    Connection(14, "Red LED", "-"),
+)
+
+
 def create_i2c_spi_example() -> Diagram:
     """Create example with multiple I2C and SPI devices."""
+    from ... import boards
+
     board = boards.raspberry_pi_5()
     registry = get_registry()
 
@@ -75,58 +100,43 @@ def create_i2c_spi_example() -> Diagram:
     spi_device = registry.create("spi_device", name="OLED Display")
     led = registry.create("led", color_name="Red")
 
-    connections = [
-        # BH1750 I2C sensor
-        Connection(1, "BH1750 Light Sensor", "VCC"),
-        Connection(9, "BH1750 Light Sensor", "GND"),
-        Connection(5, "BH1750 Light Sensor", "SCL"),
-        Connection(3, "BH1750 Light Sensor", "SDA"),
-        # SPI OLED display
-        Connection(17, "OLED Display", "VCC"),
-        Connection(20, "OLED Display", "GND"),
-        Connection(23, "OLED Display", "SCLK"),
-        Connection(19, "OLED Display", "MOSI"),
-        Connection(21, "OLED Display", "MISO"),
-        Connection(24, "OLED Display", "CS"),
-        # Simple LED
-        Connection(11, "Red LED", "+"),  # GPIO17
-        Connection(14, "Red LED", "-"),
-    ]
-
     return Diagram(
         title="I2C and SPI Devices Example",
         board=board,
         devices=[bh1750, spi_device, led],
-        connections=connections,
+        connections=list(_I2C_SPI_CONNECTIONS),
     )
 
 
+_ESP32_WEATHER_CONNECTIONS = (
+    # BME280 sensor (I2C address 0x76)
+    Connection(1, "BME280 Environmental Sensor", "VCC"),  # 3V3
+    Connection(3, "BME280 Environmental Sensor", "GND"),  # GND (left side)
+    Connection(21, "BME280 Environmental Sensor", "SDA"),  # GPIO21 (SDA)
+    Connection(27, "BME280 Environmental Sensor", "SCL"),  # GPIO22 (SCL)
+    # SSD1306 OLED (I2C address 0x3C)
+    Connection(1, "SSD1306 OLED Display", "VCC"),  # 3V3
+    Connection(4, "SSD1306 OLED Display", "GND"),  # GND (right side)
+    Connection(21, "SSD1306 OLED Display", "SDA"),  # GPIO21 (SDA)
+    Connection(27, "SSD1306 OLED Display", "SCL"),  # GPIO22 (SCL)
+)
+
+
 def create_esp32_weather_station_example() -> Diagram:
     """Create ESP32 weather station example with BME280 and OLED."""
+    from ... import boards
+
     board = boards.load_board_from_config("esp32_devkit_v1")
     registry = get_registry()
 
     bme280 = registry.create("bme280")
     oled = registry.create("ssd1306")
 
-    connections = [
-        # BME280 sensor (I2C address 0x76)
-        Connection(1, "BME280 Environmental Sensor", "VCC"),  # 3V3
-        Connection(3, "BME280 Environmental Sensor", "GND"),  # GND (left side)
-        Connection(21, "BME280 Environmental Sensor", "SDA"),  # GPIO21 (SDA)
-        Connection(27, "BME280 Environmental Sensor", "SCL"),  # GPIO22 (SCL)
-        # SSD1306 OLED (I2C address 0x3C)
-        Connection(1, "SSD1306 OLED Display", "VCC"),  # 3V3
-        Connection(4, "SSD1306 OLED Display", "GND"),  # GND (right side)
-        Connection(21, "SSD1306 OLED Display", "SDA"),  # GPIO21 (SDA)
-        Connection(27, "SSD1306 OLED Display", "SCL"),  # GPIO22 (SCL)
-    ]
-
     return Diagram(
         title="ESP32 Weather Station",
         board=board,
         devices=[bme280, oled],
-        connections=connections,
+        connections=list(_ESP32_WEATHER_CONNECTIONS),
     )
 
 
@@ -139,6 +149,10 @@ EXAMPLE_REGISTRY: dict[str, Callable[[], Diagram]] = {
 }
 
 
+# Names of built-in examples that have already validated without errors or warnings
+_VALIDATED_EXAMPLES: set[str] = set()
+
+
 def get_available_examples() -> list[str]:
     """Get list of available example names.
 
@@ -175,6 +189,10 @@ def example_command(
 
       pinviz example esp32_weather -o esp32.svg
     """
+    # The renderer (drawsvg) and board loading are imported on use so other
+    # subcommands don't pay for them at startup
+    from ...render_svg import SVGRenderer
+
     ctx = AppContext()
     log = ctx.logger
 
@@ -196,17 +214,11 @@ def example_command(
         raise typer.Exit(code=1)
 
     # Determine output path
-    if output:
-        output_path = output
-    else:
-        output_dir = Path("./out")
-        output_dir.mkdir(exist_ok=True)
-        output_path = output_dir / f"{name}.svg"
-
+    output_path = output or Path("./out") / f"{name}.svg"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with progress_indicator(ctx.console, "") as progress:
+        with progress_indicator(ctx.console, "", disable=json_output) as progress:
             task = progress.add_task(f"Generating example: {name}...", total=None)
 
             # Create the example diagram using the registry
@@ -235,14 +247,19 @@ def example_command(
                     print_error(f"Invalid theme '{theme}'. Must be 'light' or 'dark'.", ctx.console)
                     raise typer.Exit(1) from e
 
-            # Validate diagram before rendering
-            validator = DiagramValidator()
-            issues = validator.validate(diagram)
+            # Validate diagram before rendering. Built-in examples are fixed
+            # data, so one that has validated cleanly is not checked again.
+            if name in _VALIDATED_EXAMPLES:
+                issues = []
+            else:
+                validator = DiagramValidator()
+                issues = validator.validate(diagram)
 
-            if issues:
-                errors = [i for i in issues if i.level == ValidationLevel.ERROR]
-                warnings = [i for i in issues if i.level == ValidationLevel.WARNING]
+            errors, warnings, _ = partition_issues(issues)
+            if not errors and not warnings:
+                _VALIDATED_EXAMPLES.add(name)
 
+            if issues:
                 log.info(
                     "validation_completed",
                     total_issues=len(issues),
@@ -3,13 +3,28 @@
 from typing import Annotated
 
 import typer
+from rich.console import Group, RenderableType
 from rich.table import Table
 
-from ...boards import get_available_boards
 from ..context import AppContext
 from ..output import BoardInfo, DeviceInfo, ListOutputJson, output_json
 
 
+def _device_table(title: str) -> Table:
+    """Create an empty device template table for one category."""
+    table = Table(
+        title=title,
+        show_header=True,
+        header_style="bold magenta",
+        border_style="dim",
+        title_style="bold yellow",
+    )
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Description", style="white")
+    table.add_column("Documentation", style="blue dim")
+    return table
+
+
 def list_command(
     json_output: Annotated[
         bool,
@@ -31,6 +46,9 @@ def list_command(
 
       pinviz list --json
     """
+    # boards pulls in the board renderer (drawsvg) and pydantic schemas
+    from ...boards import get_available_boards
+
     ctx = AppContext()
     log = ctx.logger
 
@@ -47,15 +65,13 @@ def list_command(
     ]
 
     # List devices by category
-    registry = ctx.registry
-    categories = registry.get_categories()
+    devices_by_category = ctx.registry.group_by_category()
 
-    log.debug("device_categories_found", category_count=len(categories))
+    log.debug("device_categories_found", category_count=len(devices_by_category))
 
     # Collect all device information
     all_devices: list[DeviceInfo] = []
-    for category in sorted(categories):
-        devices = registry.list_by_category(category)
+    for category, devices in devices_by_category.items():
         for device in devices:
             all_devices.append(
                 DeviceInfo(
@@ -84,52 +100,48 @@ def list_command(
         )
         output_json(result, ctx.console)
     else:
-        # Display boards
-        ctx.console.print("\n[bold cyan]Available Boards:[/bold cyan]")
-        for board in boards:
-            aliases_str = ", ".join(board.aliases) if board.aliases else "none"
-            ctx.console.print(f"  • {board.name} (aliases: [dim]{aliases_str}[/dim])")
-        ctx.console.print()
-
-        ctx.console.print("[bold cyan]Available Device Templates:[/bold cyan]")
-
-        for category in sorted(categories):
-            devices = registry.list_by_category(category)
-
-            # Create a table for this category
-            table = Table(
-                title=f"{category.title()}",
-                show_header=True,
-                header_style="bold magenta",
-                border_style="dim",
-                title_style="bold yellow",
-            )
-            table.add_column("ID", style="cyan", no_wrap=True)
-            table.add_column("Description", style="white")
-            table.add_column("Documentation", style="blue dim")
-
-            for device in devices:
-                doc_link = f"[link={device.url}]🔗 Docs[/link]" if device.url else "[dim]—[/dim]"
-                table.add_row(
-                    device.type_id,
-                    device.description or "[dim]No description[/dim]",
-                    doc_link,
-                )
-
-            ctx.console.print(table)
+        # Buffer the whole listing and write it to the terminal in one go
+        with ctx.console:
+            # Display boards
+            ctx.console.print("\n[bold cyan]Available Boards:[/bold cyan]")
+            for board in boards:
+                aliases_str = ", ".join(board.aliases) if board.aliases else "none"
+                ctx.console.print(f"  • {board.name} (aliases: [dim]{aliases_str}[/dim])")
             ctx.console.print()
 
-        # Display examples
-        ctx.console.print("[bold cyan]Available Examples:[/bold cyan]")
+            ctx.console.print("[bold cyan]Available Device Templates:[/bold cyan]")
 
-        examples_table = Table(show_header=True, header_style="bold magenta", border_style="dim")
-        examples_table.add_column("Name", style="cyan", no_wrap=True)
-        examples_table.add_column("Description", style="white")
+            # Render all category tables in one print call, each followed by a blank line
+            category_tables: list[RenderableType] = []
+            for category, devices in devices_by_category.items():
+                table = _device_table(category.title())
+                for device in devices:
+                    doc_link = (
+                        f"[link={device.url}]🔗 Docs[/link]" if device.url else "[dim]—[/dim]"
+                    )
+                    table.add_row(
+                        device.type_id,
+                        device.description or "[dim]No description[/dim]",
+                        doc_link,
+                    )
 
-        for example in examples:
-            examples_table.add_row(example["name"], example["description"])
+                category_tables += [table, ""]
 
-        ctx.console.print(examples_table)
-        ctx.console.print()
+            ctx.console.print(Group(*category_tables))
+
+            # Display examples
+            ctx.console.print("[bold cyan]Available Examples:[/bold cyan]")
+
+            examples_table = Table(
+                show_header=True, header_style="bold magenta", border_style="dim"
+            )
+            examples_table.add_column("Name", style="cyan", no_wrap=True)
+            examples_table.add_column("Description", style="white")
+
+            for example in examples:
+                examples_table.add_row(example["name"], example["description"])
+
+            ctx.console.print(examples_table)
+            ctx.console.print()
 
     log.info("templates_listed")
@@ -2,11 +2,8 @@
 
 import typer
 
-from ...config_loader import load_diagram
-from ...layout.types import LayoutConfig
-from ...render_svg import SVGRenderer
 from ...theme import Theme
-from ...validation import DiagramValidator, ValidationLevel
+from ...validation import DiagramValidator, partition_issues
 from ..context import AppContext
 from ..decorators import handle_command_exception, progress_indicator
 from ..output import (
@@ -55,6 +52,12 @@ def render_command(
 
       pinviz render diagram.yaml --max-complexity 50  # Fail if >50 connections
     """
+    # Config loading (YAML, pydantic schemas) and the renderer (drawsvg) are
+    # imported here so other subcommands don't pay for them at startup
+    from ...config_loader import load_diagram
+    from ...layout.types import LayoutConfig
+    from ...render_svg import SVGRenderer
+
     ctx = AppContext()
     log = ctx.logger
 
@@ -63,7 +66,7 @@ def render_command(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with progress_indicator(ctx.console, "") as progress:
+        with progress_indicator(ctx.console, "", disable=json_output) as progress:
             # Load config
             task = progress.add_task("Loading configuration...", total=None)
             diagram = load_diagram(config_file, emit_validation_output=not json_output)
@@ -98,11 +101,12 @@ def render_command(
             progress.update(task, completed=True)
 
             if issues:
-                errors = [i for i in issues if i.level == ValidationLevel.ERROR]
-                warnings = [i for i in issues if i.level == ValidationLevel.WARNING]
+                errors, warnings, _ = partition_issues(issues)
 
-                if errors:
+                if errors or warnings:
                     print_validation_issues(issues, ctx.console)
+
+                if errors:
                     print_error(
                         f"Found {len(errors)} error(s). Cannot generate diagram.",
                         ctx.console,
@@ -111,7 +115,6 @@ def render_command(
 
                 # Show warnings but continue
                 if warnings:
-                    print_validation_issues(issues, ctx.console)
                     print_warning(
                         f"Found {len(warnings)} warning(s). Review carefully.", ctx.console
                     )
@@ -2,10 +2,8 @@
 
 import typer
 
-from ...config_loader import load_diagram
 from ...connection_graph import ConnectionGraph
-from ...device_validator import validate_devices
-from ...validation import DiagramValidator, ValidationLevel
+from ...validation import DiagramValidator, partition_issues
 from ..context import AppContext
 from ..decorators import handle_command_exception
 from ..output import (
@@ -66,6 +64,9 @@ def validate_command(
 
       pinviz validate diagram.yaml --show-graph
     """
+    # YAML and schema loading is kept off the CLI startup path
+    from ...config_loader import load_diagram
+
     ctx = AppContext()
     log = ctx.logger
 
@@ -101,8 +102,7 @@ def validate_command(
         if not issues:
             log.info("validation_passed", config_path=str(config_file))
         else:
-            errors = [i for i in issues if i.level == ValidationLevel.ERROR]
-            warnings = [i for i in issues if i.level == ValidationLevel.WARNING]
+            errors, warnings, _ = partition_issues(issues)
             log.info(
                 "validation_issues_found",
                 total_issues=len(issues),
@@ -184,6 +184,8 @@ def validate_devices_command(
 
       pinviz validate-devices --strict
     """
+    from ...device_validator import validate_devices
+
     ctx = AppContext()
     log = ctx.logger
 
@@ -223,15 +225,15 @@ def validate_devices_command(
             # Display errors
             if result.errors:
                 ctx.console.print("[bold red]Errors:[/bold red]")
-                for error in result.errors:
-                    ctx.console.print(f"  [red]•[/red] {error}")
+                ctx.console.print("\n".join(f"  [red]•[/red] {error}" for error in result.errors))
                 ctx.console.print()
 
             # Display warnings
             if result.warnings:
                 ctx.console.print("[bold yellow]Warnings:[/bold yellow]")
-                for warning in result.warnings:
-                    ctx.console.print(f"  [yellow]•[/yellow] {warning}")
+                ctx.console.print(
+                    "\n".join(f"  [yellow]•[/yellow] {warning}" for warning in result.warnings)
+                )
                 ctx.console.print()
 
             # Summary
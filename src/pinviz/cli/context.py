@@ -1,6 +1,7 @@
 """Application context for CLI commands."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 
 import structlog
 from rich.console import Console
@@ -19,7 +20,7 @@ class AppContext:
     Attributes:
         console: Rich console for formatted output
         logger: Structured logger instance
-        registry: Device registry for template access
+        registry: Device registry for template access, loaded on first use
 
     Example:
         >>> ctx = AppContext()
@@ -29,12 +30,16 @@ class AppContext:
 
     console: Console = field(default_factory=Console)
     logger: structlog.stdlib.BoundLogger = field(init=False)
-    registry: DeviceRegistry = field(default_factory=get_registry)
 
     def __post_init__(self):
         """Initialize logger after dataclass construction."""
         self.logger = structlog.get_logger(__name__)
 
+    @cached_property
+    def registry(self) -> DeviceRegistry:
+        """Device registry, scanned only by commands that actually list or create devices."""
+        return get_registry()
+
 
 def get_app_context() -> AppContext:
     """Factory function for creating AppContext instances.
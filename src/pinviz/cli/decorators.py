@@ -11,7 +11,6 @@ from typing import TypeVar
 import structlog
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .output import output_json, print_error
 
@@ -75,7 +74,9 @@ def handle_command_exception(
 
 
 @contextmanager
-def progress_indicator(console: Console, description: str, *, transient: bool = True):
+def progress_indicator(
+    console: Console, description: str, *, transient: bool = True, disable: bool = False
+):
     """Context manager for displaying progress indicators.
 
     Provides a simple, consistent way to show progress spinners during
@@ -86,6 +87,9 @@ def progress_indicator(console: Console, description: str, *, transient: bool =
         console: Rich console for output
         description: Initial description text for the progress indicator
         transient: If True, the progress indicator disappears when done (default: True)
+        disable: If True, nothing is displayed and no refresh thread is started,
+            e.g. for --json output (default: False). The indicator is also
+            disabled whenever the console is not a terminal.
 
     Yields:
         Progress: Rich Progress instance that can be used to update tasks
@@ -101,10 +105,19 @@ def progress_indicator(console: Console, description: str, *, transient: bool =
         ...     # Do more work
         ...     progress.update(task2, completed=True)
     """
+    # rich.progress (live display, spinners) is only needed once a command runs,
+    # so it is kept off the CLI startup path
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    # A transient spinner shows nothing when output is piped or captured, so
+    # skip Rich's live display and refresh thread entirely in that case
+    disable = disable or not console.is_terminal
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
         transient=transient,
+        disable=disable,
     ) as progress:
         yield progress
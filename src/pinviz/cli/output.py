@@ -1,5 +1,6 @@
 """Rich output helpers for consistent CLI UX."""
 
+import json
 from typing import Any, Literal
 
 from pydantic import BaseModel
@@ -7,7 +8,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ..validation import ValidationIssue, ValidationLevel
+from ..validation import ValidationIssue, partition_issues
 
 
 def print_validation_issues(
@@ -39,9 +40,7 @@ def print_validation_issues(
         return
 
     # Categorize issues by level
-    errors = [i for i in issues if i.level == ValidationLevel.ERROR]
-    warnings = [i for i in issues if i.level == ValidationLevel.WARNING]
-    infos = [i for i in issues if i.level == ValidationLevel.INFO]
+    errors, warnings, infos = partition_issues(issues)
 
     # Create rich table
     table = Table(show_header=True, header_style="bold", show_edge=False)
@@ -229,6 +228,17 @@ def output_json(data: BaseModel | dict[str, Any], console: Console) -> None:
         ... )
         >>> output_json(data, console)
     """
+    if not console.is_terminal:
+        # Piped or captured output is read by programs, so skip Rich's JSON
+        # highlighting and let pydantic serialize models directly. The text is
+        # identical to what print_json() would produce.
+        if isinstance(data, BaseModel):
+            text = data.model_dump_json(indent=2, exclude_none=True)
+        else:
+            text = json.dumps(data, indent=2, ensure_ascii=False)
+        console.out(text, highlight=False)
+        return
+
     if isinstance(data, BaseModel):
         json_data = data.model_dump(mode="json", exclude_none=True)
     else:
@@ -259,8 +269,5 @@ def get_validation_summary(issues: list[ValidationIssue]) -> ValidationSummary:
     Returns:
         ValidationSummary with counts by level
     """
-    return ValidationSummary(
-        errors=len([i for i in issues if i.level == ValidationLevel.ERROR]),
-        warnings=len([i for i in issues if i.level == ValidationLevel.WARNING]),
-        infos=len([i for i in issues if i.level == ValidationLevel.INFO]),
-    )
+    errors, warnings, infos = partition_issues(issues)
+    return ValidationSummary(errors=len(errors), warnings=len(warnings), infos=len(infos))
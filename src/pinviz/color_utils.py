@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-import re
+import string
+from functools import lru_cache
 
 from .model import WireColor
 
+_HEX_DIGITS = frozenset(string.hexdigits)
 
+# Upper-case WireColor member names (aliases included) to hex values
+_NAME_TO_HEX: dict[str, str] = {
+    name: member.value for name, member in WireColor.__members__.items()
+}
+
+
+# Diagrams reuse a handful of color names and hex codes across every device and
+# wire, so resolved values are memoized (bounded, since inputs come from configs)
+@lru_cache(maxsize=256)
 def resolve_color(color_input: str | None, default: str = "#4A90E2") -> str:
     """
     Convert named color or hex code to hex format.
@@ -40,16 +51,14 @@ def resolve_color(color_input: str | None, default: str = "#4A90E2") -> str:
 
     # Strip whitespace and try matching against WireColor enum (case-insensitive)
     color_input = color_input.strip()
-    color_upper = color_input.upper()
-    try:
-        # Try to get the color from WireColor enum
-        wire_color = WireColor[color_upper]
-        return wire_color.value
-    except KeyError:
-        pass
-
-    # Check if it's a valid hex format
-    if re.match(r"^#[0-9A-Fa-f]{6}$", color_input):
+    named = _NAME_TO_HEX.get(color_input.upper())
+    if named is not None:
+        return named
+
+    # Check if it's a valid #RRGGBB hex code. A digit-set check is used rather
+    # than int(..., 16), which would also accept signs, underscores and
+    # non-ASCII digits
+    if len(color_input) == 7 and color_input[0] == "#" and _HEX_DIGITS.issuperset(color_input[1:]):
         return color_input
 
     # Invalid color - return default
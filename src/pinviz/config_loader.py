@@ -1,6 +1,7 @@
 """Load diagram configurations from YAML/JSON files."""
 
 import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -27,13 +28,20 @@ from .pin_assignment import PinAssigner
 from .schemas import ConnectionSchema, validate_config
 from .theme import Theme
 from .utils import is_output_pin
-from .validation import DiagramValidator, ValidationIssue, ValidationLevel
+from .validation import DiagramValidator, ValidationIssue, ValidationLevel, partition_issues
 
 log = get_logger(__name__)
 
 # Maximum config file size in bytes (10MB)
 MAX_CONFIG_FILE_SIZE = 10 * 1024 * 1024
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigLoader:
     """
@@ -108,7 +116,7 @@ class ConfigLoader:
         # Load file based on extension
         if path.suffix in [".yaml", ".yml"]:
             with open(path) as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             log.debug("yaml_config_parsed", config_path=str(path))
         elif path.suffix == ".json":
             with open(path) as f:
@@ -231,8 +239,7 @@ class ConfigLoader:
         validation_issues = self._validate_graph(graph, diagram_devices, connections)
 
         # Check for critical errors
-        errors = [issue for issue in validation_issues if issue.level == ValidationLevel.ERROR]
-        warnings = [issue for issue in validation_issues if issue.level == ValidationLevel.WARNING]
+        errors, warnings, _ = partition_issues(validation_issues)
 
         if errors:
             if self.emit_validation_output:
@@ -830,3 +837,47 @@ def load_diagram(config_path: str | Path, *, emit_validation_output: bool = True
     """
     loader = ConfigLoader(emit_validation_output=emit_validation_output)
     return loader.load_from_file(config_path)
+
+
+def load_diagrams(
+    config_paths: Iterable[str | Path], *, emit_validation_output: bool = True
+) -> Iterator[Diagram]:
+    """
+    Load several diagrams from files, sharing one loader across all of them.
+
+    Equivalent to calling :func:`load_diagram` for each path, but the
+    :class:`ConfigLoader` and its board selection strategy are built once, which
+    helps when batch-processing a directory of configurations. Diagrams are
+    yielded lazily in input order.
+
+    Args:
+        config_paths: Paths to YAML or JSON configuration files
+        emit_validation_output: Whether to print graph validation details
+
+    Yields:
+        Diagram objects, one per path
+    """
+    loader = ConfigLoader(emit_validation_output=emit_validation_output)
+    for config_path in config_paths:
+        yield loader.load_from_file(config_path)
+
+
+def load_diagram_from_dict(
+    config: dict[str, Any], *, emit_validation_output: bool = True
+) -> Diagram:
+    """
+    Convenience function to load a diagram from an already-parsed configuration.
+
+    Runs the same schema and graph validation as :func:`load_diagram` but skips
+    reading and parsing a file, which is useful when the configuration was built
+    in memory (e.g. the MCP server's ``output_format="dict"`` response).
+
+    Args:
+        config: Configuration dictionary with the same structure as a YAML/JSON file
+        emit_validation_output: Whether to print graph validation details
+
+    Returns:
+        Diagram object
+    """
+    loader = ConfigLoader(emit_validation_output=emit_validation_output)
+    return loader.load_from_dict(config)
@@ -301,6 +301,26 @@ class DeviceRegistry:
         categories = {t.category for t in self._templates.values()}
         return sorted(categories)
 
+    def group_by_category(self) -> dict[str, list[DeviceTemplate]]:
+        """
+        Get all device templates grouped by category in a single pass.
+
+        Equivalent to calling list_by_category() for every entry of
+        get_categories(), without rescanning the registry per category.
+
+        Returns:
+            Dictionary mapping category names (sorted) to their device templates
+
+        Example:
+            >>> registry = get_registry()
+            >>> for category, templates in registry.group_by_category().items():
+            ...     print(f"{category}: {len(templates)} devices")
+        """
+        grouped: dict[str, list[DeviceTemplate]] = {}
+        for template in self._templates.values():
+            grouped.setdefault(template.category, []).append(template)
+        return {category: grouped[category] for category in sorted(grouped)}
+
 
 # Optional default registry instance (lazy-loaded)
 _default_registry: DeviceRegistry | None = None
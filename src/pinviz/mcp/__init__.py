@@ -1,9 +1,10 @@
 """PinViz MCP Server - Natural language to GPIO wiring diagrams."""
 
-# Get version from package metadata
-try:
-    from importlib.metadata import version
 
-    __version__ = version("pinviz")
-except Exception:
-    __version__ = "unknown"
+def __getattr__(name: str) -> str:
+    """Share the top-level package's lazily resolved __version__."""
+    if name == "__version__":
+        from .. import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
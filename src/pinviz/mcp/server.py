@@ -12,15 +12,43 @@ Resources:
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from mcp.server.mcpserver import MCPServer
 
 from pinviz.connection_graph import ConnectionGraph
-from pinviz.validation import DiagramValidator, ValidationLevel
+from pinviz.validation import DiagramValidator, partition_issues
 
 from .connection_builder import ConnectionBuilder
 from .device_manager import Device, DeviceManager, DevicePin
+from .yaml_emitter import dump_diagram_config
+
+# orjson serializes in C and is noticeably faster on the larger tool responses
+# (e.g. generate_diagram embeds the whole YAML document); use it when installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: object, indent: int | None = None) -> str:
+    """Serialize a tool response to a JSON string.
+
+    Args:
+        obj: JSON-serializable response payload
+        indent: Pretty-print indentation (orjson only supports 2)
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=indent)
+
 
 # Initialize MCP server
 mcp = MCPServer("PinViz Diagram Generator")
@@ -67,7 +95,7 @@ def list_devices(
         ],
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -88,9 +116,9 @@ def get_device_info(device_id: str) -> str:
         device = device_manager.get_device_by_name(device_id, fuzzy=True)
 
     if device is None:
-        return json.dumps({"error": f"Device '{device_id}' not found"})
+        return _dumps({"error": f"Device '{device_id}' not found"})
 
-    return json.dumps(device.to_dict(), indent=2)
+    return _dumps(device.to_dict(), indent=2)
 
 
 @mcp.tool()
@@ -119,7 +147,7 @@ def search_devices_by_tags(tags: list[str]) -> str:
         ],
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -130,7 +158,7 @@ def get_database_summary() -> str:
         JSON string with database statistics
     """
     summary = device_manager.get_summary()
-    return json.dumps(summary, indent=2)
+    return _dumps(summary, indent=2)
 
 
 @mcp.tool()
@@ -145,7 +173,7 @@ def generate_diagram(prompt: str, output_format: str = "yaml", title: str | None
 
     Args:
         prompt: Natural language description (e.g., "connect BME280 and LED")
-        output_format: Output format - 'yaml', 'json', or 'summary' (default: yaml)
+        output_format: Output format - 'yaml', 'dict', 'json', or 'summary' (default: yaml)
         title: Optional diagram title (auto-generated if not provided)
 
     Returns:
@@ -157,231 +185,268 @@ def generate_diagram(prompt: str, output_format: str = "yaml", title: str | None
           pinviz render diagram.yaml -o output.svg
         - DO NOT modify or reconstruct the YAML - use the 'yaml_content' field exactly as provided
         - The YAML includes full device pin definitions required by the pinviz CLI
+
+        When output_format is 'dict':
+        - The response contains a 'diagram' field with the same configuration as
+          structured data, ready for pinviz.config_loader.load_diagram_from_dict()
+    """
+    # Responses are memoized per (prompt, output_format, title); exceptions are
+    # not cached so transient failures are retried on the next call
+    try:
+        return _generate_diagram_response(prompt, output_format, title)
+    except Exception as e:
+        return _dumps(
+            {
+                "status": "error",
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "prompt": prompt,
+            },
+            indent=2,
+        )
+
+
+@lru_cache(maxsize=256)
+def _generate_diagram_response(prompt: str, output_format: str, title: str | None) -> str:
+    """Build the generate_diagram JSON response.
+
+    Parsing the prompt, assigning pins and validating the diagram is
+    deterministic for a given device database, so repeated prompts are served
+    from an LRU cache. The cache is cleared whenever the user device database
+    changes.
+
+    Raises:
+        Exception: Any failure while building the diagram; generate_diagram
+            turns it into an error response
     """
     from pinviz.board_selection import AliasBoardSelectionStrategy
     from pinviz.pin_assignment import PinAssigner
 
     from .parser import PromptParser
 
-    try:
-        # Step 1: Parse natural language prompt
-        parser = PromptParser(use_llm=False)
-        parsed = parser.parse(prompt)
-
-        if not parsed.devices:
-            return json.dumps(
-                {
-                    "status": "error",
-                    "error": "No devices found in prompt",
-                    "prompt": prompt,
-                    "suggestion": "Try: 'connect BME280' or 'BME280 and LED'",
-                },
-                indent=2,
-            )
+    # Step 1: Parse natural language prompt
+    parser = PromptParser(use_llm=False)
+    parsed = parser.parse(prompt)
 
-        # Step 1.5: Resolve board early so PinAssigner can use it
-        board_strategy = AliasBoardSelectionStrategy(fallback_board_name="raspberry_pi_5")
-        board = board_strategy.select_board(parsed.board)
+    if not parsed.devices:
+        return _dumps(
+            {
+                "status": "error",
+                "error": "No devices found in prompt",
+                "prompt": prompt,
+                "suggestion": "Try: 'connect BME280' or 'BME280 and LED'",
+            },
+            indent=2,
+        )
 
-        # Step 2: Look up devices in database
-        devices_data = []
-        not_found = []
+    # Step 1.5: Resolve board early so PinAssigner can use it
+    board_strategy = AliasBoardSelectionStrategy(fallback_board_name="raspberry_pi_5")
+    board = board_strategy.select_board(parsed.board)
 
-        for device_name in parsed.devices:
-            # Try fuzzy matching
-            device = device_manager.get_device_by_name(device_name, fuzzy=True)
-            if device:
-                devices_data.append(device.to_dict())
-            else:
-                not_found.append(device_name)
+    # Step 2: Look up devices in database
+    devices_data = []
+    not_found = []
 
-        if not devices_data:
-            return json.dumps(
-                {
-                    "status": "error",
-                    "error": "No matching devices found in database",
-                    "requested": parsed.devices,
-                    "suggestion": "Use list_devices tool to see available devices",
-                },
-                indent=2,
-            )
+    for device_name in parsed.devices:
+        # Try fuzzy matching
+        device = device_manager.get_device_by_name(device_name, fuzzy=True)
+        if device:
+            devices_data.append(device.to_dict())
+        else:
+            not_found.append(device_name)
 
-        # Step 3: Assign pins intelligently
-        pin_assigner = PinAssigner(board)
-        assignments, warnings = pin_assigner.assign_pins(devices_data)
-
-        # Step 3.5: Build complete diagram and validate
-        builder = ConnectionBuilder(board_selection_strategy=board_strategy)
-        diagram = builder.build_diagram(
-            assignments=assignments,
-            devices_data=devices_data,
-            board=board,
-            title=title
-            or (
-                f"{', '.join([d['name'] for d in devices_data])} Wiring"
-                if len(devices_data) <= 3
-                else "Multi-Device Wiring Diagram"
-            ),
+    if not devices_data:
+        return _dumps(
+            {
+                "status": "error",
+                "error": "No matching devices found in database",
+                "requested": parsed.devices,
+                "suggestion": "Use list_devices tool to see available devices",
+            },
+            indent=2,
         )
 
-        # Validate the diagram — structural + electrical
-        # Structural: cycles, orphans
-        graph = ConnectionGraph(diagram.devices, diagram.connections)
-        cycles = graph.detect_cycles()
-        structural_issues = []
-        if cycles:
-            for cycle in cycles:
-                cycle_path = " → ".join(cycle)
-                structural_issues.append(f"Cycle detected: {cycle_path}")
-
-        # Electrical: voltage, pin compatibility, current limits
-        validator = DiagramValidator()
-        validation_issues = validator.validate(diagram)
-
-        # Categorize validation issues
-        validation_errors = [i for i in validation_issues if i.level == ValidationLevel.ERROR]
-        validation_warnings = [i for i in validation_issues if i.level == ValidationLevel.WARNING]
-        validation_infos = [i for i in validation_issues if i.level == ValidationLevel.INFO]
-
-        # Include structural issues as errors
-        all_error_strings = structural_issues + [str(e) for e in validation_errors]
-
-        # Step 4: Generate diagram output
-        diagram_title = diagram.title
-
-        # Generate connections list for output
-        connections = [
+    # Step 3: Assign pins intelligently
+    pin_assigner = PinAssigner(board)
+    assignments, warnings = pin_assigner.assign_pins(devices_data)
+
+    # Step 3.5: Build complete diagram and validate
+    builder = ConnectionBuilder(board_selection_strategy=board_strategy)
+    diagram = builder.build_diagram(
+        assignments=assignments,
+        devices_data=devices_data,
+        board=board,
+        title=title
+        or (
+            f"{', '.join([d['name'] for d in devices_data])} Wiring"
+            if len(devices_data) <= 3
+            else "Multi-Device Wiring Diagram"
+        ),
+    )
+
+    # Validate the diagram — structural + electrical
+    # Structural: cycles, orphans
+    graph = ConnectionGraph(diagram.devices, diagram.connections)
+    cycles = graph.detect_cycles()
+    structural_issues = []
+    if cycles:
+        for cycle in cycles:
+            cycle_path = " → ".join(cycle)
+            structural_issues.append(f"Cycle detected: {cycle_path}")
+
+    # Electrical: voltage, pin compatibility, current limits
+    validator = DiagramValidator()
+    validation_issues = validator.validate(diagram)
+
+    # Categorize validation issues
+    validation_errors, validation_warnings, validation_infos = partition_issues(validation_issues)
+
+    # Include structural issues as errors
+    all_error_strings = structural_issues + [str(e) for e in validation_errors]
+
+    # Step 4: Generate diagram output
+    diagram_title = diagram.title
+
+    # Generate connections list for output
+    connections = [
+        {
+            "board_pin": a.board_pin_number,
+            "device": a.device_name,
+            "device_pin": a.device_pin_name,
+            "role": a.pin_role.value,
+        }
+        for a in assignments
+    ]
+
+    # PinViz configuration with full device definitions, shared by the
+    # "dict" and "yaml" output formats
+    config_devices = []
+    for device_data in devices_data:
+        config_device = {"name": device_data["name"]}
+        if device_data.get("pins"):
+            config_device["pins"] = [
+                {"name": pin["name"], "role": pin["role"]} for pin in device_data["pins"]
+            ]
+        config_devices.append(config_device)
+
+    diagram_config = {
+        "title": diagram_title,
+        "board": parsed.board,
+        "devices": config_devices,
+        "connections": [
             {
-                "board_pin": a.board_pin_number,
-                "device": a.device_name,
-                "device_pin": a.device_pin_name,
-                "role": a.pin_role.value,
+                "board_pin": conn["board_pin"],
+                "device": conn["device"],
+                "device_pin": conn["device_pin"],
             }
-            for a in assignments
-        ]
+            for conn in connections
+        ],
+    }
 
-        # Prepare result based on format
-        result = {
-            "status": "success",
-            "title": diagram_title,
-            "board": parsed.board,
-            "devices": [d["name"] for d in devices_data],
-            "connections": len(assignments),
-            "parsing_method": parsed.parsing_method,
-            "confidence": parsed.confidence,
-        }
+    # Prepare result based on format
+    result = {
+        "status": "success",
+        "title": diagram_title,
+        "board": parsed.board,
+        "devices": [d["name"] for d in devices_data],
+        "connections": len(assignments),
+        "parsing_method": parsed.parsing_method,
+        "confidence": parsed.confidence,
+    }
 
-        if warnings:
-            result["warnings"] = warnings
+    if warnings:
+        result["warnings"] = warnings
 
-        if not_found:
-            result["not_found"] = not_found
+    if not_found:
+        result["not_found"] = not_found
 
-        # Add validation results
-        if validation_issues or structural_issues:
-            result["validation"] = {
-                "total_issues": len(validation_issues) + len(structural_issues),
-                "errors": all_error_strings,
-                "warnings": [str(w) for w in validation_warnings],
-                "info": [str(i) for i in validation_infos],
-            }
+    # Add validation results
+    if validation_issues or structural_issues:
+        result["validation"] = {
+            "total_issues": len(validation_issues) + len(structural_issues),
+            "errors": all_error_strings,
+            "warnings": [str(w) for w in validation_warnings],
+            "info": [str(i) for i in validation_infos],
+        }
 
-            # Update status if there are errors
-            if all_error_strings:
-                result["status"] = "error"
-                result["validation_status"] = "failed"
-                result["validation_message"] = (
-                    f"Diagram has {len(all_error_strings)} validation error(s). "
-                    "These issues could cause hardware damage or circuit malfunction. "
-                    "Review the 'validation.errors' field for details."
-                )
-            elif validation_warnings:
-                result["validation_status"] = "warning"
-                result["validation_message"] = (
-                    f"Diagram has {len(validation_warnings)} validation warning(s). "
-                    "These should be reviewed. See 'validation.warnings' for details."
-                )
-            else:
-                result["validation_status"] = "info"
+        # Update status if there are errors
+        if all_error_strings:
+            result["status"] = "error"
+            result["validation_status"] = "failed"
+            result["validation_message"] = (
+                f"Diagram has {len(all_error_strings)} validation error(s). "
+                "These issues could cause hardware damage or circuit malfunction. "
+                "Review the 'validation.errors' field for details."
+            )
+        elif validation_warnings:
+            result["validation_status"] = "warning"
+            result["validation_message"] = (
+                f"Diagram has {len(validation_warnings)} validation warning(s). "
+                "These should be reviewed. See 'validation.warnings' for details."
+            )
         else:
-            result["validation"] = {
-                "total_issues": 0,
-                "errors": [],
-                "warnings": [],
-                "info": [],
-            }
-            result["validation_status"] = "passed"
-            result["validation_message"] = "All validation checks passed."
-
-        if output_format == "yaml":
-            # Generate YAML-style output with full device definitions
-            yaml_output = f"""title: "{diagram_title}"
-board: "{parsed.board}"
-devices:
-"""
-            for device_data in devices_data:
-                yaml_output += f'  - name: "{device_data["name"]}"\n'
-                # Add pins array with full pin definitions
-                if "pins" in device_data and device_data["pins"]:
-                    yaml_output += "    pins:\n"
-                    for pin in device_data["pins"]:
-                        yaml_output += f'      - name: "{pin["name"]}"\n'
-                        yaml_output += f'        role: "{pin["role"]}"\n'
-
-            yaml_output += "\nconnections:\n"
-            for conn in connections:
-                yaml_output += f"  - board_pin: {conn['board_pin']}\n"
-                yaml_output += f'    device: "{conn["device"]}"\n'
-                yaml_output += f'    device_pin: "{conn["device_pin"]}"\n'
-
-            result["yaml_content"] = yaml_output
-            result["output"] = yaml_output  # Keep for backward compatibility
-
-            # Customize message based on validation status
-            if validation_errors:
-                result["message"] = (
-                    "YAML configuration generated but has VALIDATION ERRORS. "
-                    "Review 'validation.errors' before using. These issues could damage hardware."
-                )
-            elif validation_warnings:
-                result["message"] = (
-                    "YAML configuration generated with validation warnings. "
-                    "Review 'validation.warnings' before using. "
-                    "Save the 'yaml_content' field to a file and render with: "
-                    "pinviz render <file>.yaml -o output.svg"
-                )
-            else:
-                result["message"] = (
-                    "Complete PinViz YAML configuration generated and validated. "
-                    "Save the 'yaml_content' field to a file and render with: "
-                    "pinviz render <file>.yaml -o output.svg"
-                )
-
-        elif output_format == "json":
-            result["details"] = {
-                "devices": devices_data,
-                "connections": connections,
-            }
+            result["validation_status"] = "info"
+    else:
+        result["validation"] = {
+            "total_issues": 0,
+            "errors": [],
+            "warnings": [],
+            "info": [],
+        }
+        result["validation_status"] = "passed"
+        result["validation_message"] = "All validation checks passed."
+
+    if output_format == "yaml":
+        # Generate YAML output with full device definitions
+        yaml_output = dump_diagram_config(diagram_config)
+
+        result["yaml_content"] = yaml_output
+        result["output"] = yaml_output  # Keep for backward compatibility
 
-        else:  # summary format
-            result["summary"] = (
-                f"Generated diagram with {len(devices_data)} device(s) "
-                f"and {len(assignments)} connection(s)"
+        # Customize message based on validation status
+        if validation_errors:
+            result["message"] = (
+                "YAML configuration generated but has VALIDATION ERRORS. "
+                "Review 'validation.errors' before using. These issues could damage hardware."
+            )
+        elif validation_warnings:
+            result["message"] = (
+                "YAML configuration generated with validation warnings. "
+                "Review 'validation.warnings' before using. "
+                "Save the 'yaml_content' field to a file and render with: "
+                "pinviz render <file>.yaml -o output.svg"
+            )
+        else:
+            result["message"] = (
+                "Complete PinViz YAML configuration generated and validated. "
+                "Save the 'yaml_content' field to a file and render with: "
+                "pinviz render <file>.yaml -o output.svg"
             )
 
-        return json.dumps(result, indent=2)
+    elif output_format == "dict":
+        # Hand back the configuration as structured data so in-process
+        # callers can pass it to load_diagram_from_dict() without a YAML
+        # emit/parse round-trip.
+        result["diagram"] = diagram_config
+        result["message"] = (
+            "PinViz configuration generated as a dictionary in the 'diagram' field. "
+            "Load it with pinviz.config_loader.load_diagram_from_dict()."
+        )
 
-    except Exception as e:
-        return json.dumps(
-            {
-                "status": "error",
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "prompt": prompt,
-            },
-            indent=2,
+    elif output_format == "json":
+        result["details"] = {
+            "devices": devices_data,
+            "connections": connections,
+        }
+
+    else:  # summary format
+        result["summary"] = (
+            f"Generated diagram with {len(devices_data)} device(s) "
+            f"and {len(assignments)} connection(s)"
         )
 
+    return _dumps(result, indent=2)
+
 
 @mcp.resource("device://database")
 def get_device_database() -> str:
@@ -415,7 +480,7 @@ def get_categories() -> str:
         JSON list of category names
     """
     categories = device_manager.list_categories()
-    return json.dumps({"categories": categories}, indent=2)
+    return _dumps({"categories": categories}, indent=2)
 
 
 @mcp.resource("device://protocols")
@@ -426,7 +491,7 @@ def get_protocols() -> str:
         JSON list of protocol names
     """
     protocols = device_manager.list_protocols()
-    return json.dumps({"protocols": protocols}, indent=2)
+    return _dumps({"protocols": protocols}, indent=2)
 
 
 @mcp.tool()
@@ -449,7 +514,7 @@ def add_user_device(device_data: dict) -> str:
         is_valid, errors = validate_device_entry(device_data)
 
         if not is_valid:
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "error",
                     "error": "Device validation failed",
@@ -491,8 +556,9 @@ def add_user_device(device_data: dict) -> str:
 
         # Add to user database
         device_manager.add_user_device(device)
+        _generate_diagram_response.cache_clear()
 
-        return json.dumps(
+        return _dumps(
             {
                 "status": "success",
                 "message": f"Device '{device.name}' added to user database with ID '{device.id}'",
@@ -502,7 +568,7 @@ def add_user_device(device_data: dict) -> str:
         )
 
     except Exception as e:
-        return json.dumps(
+        return _dumps(
             {
                 "status": "error",
                 "error": str(e),
@@ -536,7 +602,7 @@ def list_user_devices() -> str:
         ],
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -552,7 +618,8 @@ def remove_user_device(device_id: str) -> str:
     success = device_manager.remove_user_device(device_id)
 
     if success:
-        return json.dumps(
+        _generate_diagram_response.cache_clear()
+        return _dumps(
             {
                 "status": "success",
                 "message": f"Device '{device_id}' removed from user database",
@@ -560,7 +627,7 @@ def remove_user_device(device_id: str) -> str:
             indent=2,
         )
     else:
-        return json.dumps(
+        return _dumps(
             {
                 "status": "error",
                 "error": f"Device '{device_id}' not found in user database",
@@ -0,0 +1,50 @@
+"""Minimal YAML emitter for MCP-generated diagram configurations."""
+
+import json
+
+
+def _quote(value: object) -> str:
+    """Quote a scalar as a YAML double-quoted string.
+
+    JSON string escapes are a subset of YAML's double-quoted escapes, so
+    json.dumps produces a valid YAML scalar for any string.
+    """
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def dump_diagram_config(config: dict) -> str:
+    """
+    Serialize a generated diagram configuration to PinViz YAML.
+
+    The MCP server only produces a fixed shape (title, board, devices with
+    optional pin lists, and board-to-device connections), so it is written
+    directly instead of going through yaml.dump's representer machinery.
+
+    Args:
+        config: Diagram configuration with "title", "board", "devices" and
+            "connections" keys, as built by generate_diagram
+
+    Returns:
+        YAML document loadable with pinviz.config_loader.load_diagram()
+    """
+    lines = [
+        f"title: {_quote(config['title'])}",
+        f"board: {_quote(config['board'])}",
+        "devices:",
+    ]
+    for device in config["devices"]:
+        lines.append(f"  - name: {_quote(device['name'])}")
+        if device.get("pins"):
+            lines.append("    pins:")
+            for pin in device["pins"]:
+                lines.append(f"      - name: {_quote(pin['name'])}")
+                lines.append(f"        role: {_quote(pin['role'])}")
+
+    lines.append("")
+    lines.append("connections:")
+    for conn in config["connections"]:
+        lines.append(f"  - board_pin: {int(conn['board_pin'])}")
+        lines.append(f"    device: {_quote(conn['device'])}")
+        lines.append(f"    device_pin: {_quote(conn['device_pin'])}")
+
+    return "\n".join(lines) + "\n"
@@ -147,7 +147,7 @@ DEFAULT_COLORS: dict[PinRole, str] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Point:
     """
     A 2D point in SVG coordinate space.
@@ -287,7 +287,7 @@ class Board:
         return next((p for p in self.pins if p.name == name), None)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DevicePin:
     """
     A pin on a device or module.
@@ -397,7 +397,7 @@ class ComponentType(StrEnum):
     DIODE = "diode"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Component:
     """
     An inline component placed on a wire connection.
@@ -417,7 +417,7 @@ class Component:
     position: float = 0.55  # Position along wire path (0.0-1.0, default 55% from source)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Connection:
     """
     A wire connection between a board pin and a device pin, or between two devices.
@@ -656,7 +656,7 @@ class Connection:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Diagram:
     """
     A complete GPIO wiring diagram.
@@ -17,6 +17,9 @@ from .wire_renderer import WireRenderer
 
 log = get_logger(__name__)
 
+# Clark-notation prefix ElementTree puts on SVG tags and attributes
+SVG_NS_PREFIX = "{http://www.w3.org/2000/svg}"
+
 
 def _short_pin_label(pin) -> str:
     """
@@ -37,6 +40,29 @@ def _short_pin_label(pin) -> str:
     return name
 
 
+def _serialize_static_layer(element: draw.DrawingElement) -> str | None:
+    """
+    Serialize a self-contained drawing element to SVG markup.
+
+    The result can be spliced into another drawing with ``draw.Raw``. Elements
+    that need entries in ``<defs>`` (gradients, markers, ...) depend on ids
+    assigned by the enclosing drawing, so they are not serialized.
+
+    Args:
+        element: The element to serialize
+
+    Returns:
+        The element's SVG markup, or None if it cannot be reused verbatim
+    """
+    scratch = draw.Drawing(0, 0)
+    scratch.append(element)
+    document = scratch.as_svg(header="")
+    _, separator, body = document.partition("<defs>\n</defs>\n")
+    if not separator:
+        return None
+    return body.removesuffix("</svg>").removesuffix("\n")
+
+
 class SVGRenderer:
     """
     Render GPIO wiring diagrams to SVG format.
@@ -70,6 +96,11 @@ class SVGRenderer:
         >>> renderer.render(diagram, "led_circuit.svg")
     """
 
+    # Serialized board layers keyed by asset identity and placement. The board SVG
+    # asset is the same across renders, so it is inlined and serialized once per
+    # process and then spliced into each drawing verbatim.
+    _static_board_cache: dict[tuple, str] = {}
+
     def __init__(self, layout_config: LayoutConfig | None = None):
         """
         Initialize SVG renderer with optional layout configuration.
@@ -112,6 +143,24 @@ class SVGRenderer:
             connection_count=len(diagram.connections),
         )
 
+        dwg = self._build_drawing(diagram)
+
+        # Save: serialize once and hand the encoded document to a single write
+        # rather than streaming many small writes through a text-mode file object
+        log.debug("saving_svg", output_path=str(output_path))
+        Path(output_path).write_bytes(dwg.as_svg().encode("utf-8"))
+        log.info("render_completed", output_path=str(output_path))
+
+    def _build_drawing(self, diagram: Diagram) -> draw.Drawing:
+        """
+        Lay out a diagram and draw it onto a new SVG drawing.
+
+        Args:
+            diagram: The diagram to render
+
+        Returns:
+            The populated drawsvg Drawing
+        """
         # Get color scheme from theme
         color_scheme = get_color_scheme(diagram.theme)
 
@@ -209,10 +258,7 @@ class SVGRenderer:
         if diagram.show_legend:
             self._draw_device_specs_table(dwg, diagram, board_margin_top, color_scheme)
 
-        # Save
-        log.debug("saving_svg", output_path=str(output_path))
-        dwg.save_svg(str(output_path))
-        log.info("render_completed", output_path=str(output_path))
+        return dwg
 
     def _draw_board(
         self,
@@ -260,21 +306,45 @@ class SVGRenderer:
         elif Path(board.svg_asset_path).exists():
             log.debug("using_legacy_svg_asset", board_name=board.name, path=board.svg_asset_path)
             try:
-                # Parse the SVG file
-                tree = ET.parse(board.svg_asset_path)
-                root = tree.getroot()
-
-                # Create a group for the board with proper positioning and scaling
                 svg_scale = getattr(board, "svg_scale", 1.0)
-                if svg_scale != 1.0:
-                    board_group = draw.Group(transform=f"translate({x}, {y}) scale({svg_scale})")
-                else:
-                    board_group = draw.Group(transform=f"translate({x}, {y})")
-
-                # Inline the SVG content by parsing and recreating elements
-                self._inline_svg_elements(board_group, root, dwg, show_board_name)
-
-                dwg.append(board_group)
+                asset_stat = Path(board.svg_asset_path).stat()
+                # Asset mtime and size are part of the key so an edited asset is re-inlined
+                cache_key = (
+                    board.svg_asset_path,
+                    asset_stat.st_mtime_ns,
+                    asset_stat.st_size,
+                    x,
+                    y,
+                    svg_scale,
+                    show_board_name,
+                )
+                board_layer = self._static_board_cache.get(cache_key)
+
+                if board_layer is None:
+                    # Parse the SVG file
+                    tree = ET.parse(board.svg_asset_path)
+                    root = tree.getroot()
+
+                    # Create a group for the board with proper positioning and scaling
+                    if svg_scale != 1.0:
+                        board_group = draw.Group(
+                            transform=f"translate({x}, {y}) scale({svg_scale})"
+                        )
+                    else:
+                        board_group = draw.Group(transform=f"translate({x}, {y})")
+
+                    # Inline the SVG content by parsing and recreating elements
+                    self._inline_svg_elements(board_group, root, dwg, show_board_name)
+
+                    board_layer = _serialize_static_layer(board_group)
+                    if board_layer is None:
+                        dwg.append(board_group)
+                    else:
+                        log.debug("caching_board_layer", board_name=board.name)
+                        self._static_board_cache[cache_key] = board_layer
+
+                if board_layer is not None:
+                    dwg.append(draw.Raw(board_layer))
 
                 board_width = board.width
                 board_height = board.height
@@ -459,8 +529,7 @@ class SVGRenderer:
             dwg: Main drawing object
             show_board_name: Whether to include board name text from SVG
         """
-        # SVG namespace
-        svg_ns = "{http://www.w3.org/2000/svg}"
+        svg_ns = SVG_NS_PREFIX
 
         # Process all children of the SVG root (skip root itself)
         for child in svg_root:
@@ -611,7 +680,7 @@ class SVGRenderer:
 
     def _parse_stop_attributes(self, stop_element) -> dict:
         """Parse gradient stop attributes, handling inline styles."""
-        svg_ns = "{http://www.w3.org/2000/svg}"
+        svg_ns = SVG_NS_PREFIX
         attribs = {k.replace(svg_ns, ""): v for k, v in stop_element.attrib.items()}
 
         # Parse style attribute if present
@@ -847,14 +916,4 @@ class SVGRenderer:
         Returns:
             SVG content as string
         """
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".svg", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            self.render(diagram, temp_path)
-            with open(temp_path) as f:
-                return f.read()
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        return self._build_drawing(diagram).as_svg()
@@ -77,6 +77,18 @@ PIN_COMPATIBILITY_MATRIX: dict[tuple[PinRole, PinRole], tuple[bool, str | None]]
 }
 
 
+# Board pin roles that make up a shared I2C or SPI bus
+_SHARED_BUS_ROLES = frozenset(
+    {
+        PinRole.I2C_SDA,
+        PinRole.I2C_SCL,
+        PinRole.SPI_MOSI,
+        PinRole.SPI_MISO,
+        PinRole.SPI_SCLK,
+    }
+)
+
+
 def check_pin_compatibility(source_role: PinRole, target_role: PinRole) -> tuple[bool, str | None]:
     """
     Check if two pin roles are compatible for connection.
@@ -169,6 +181,32 @@ class ValidationIssue:
         return f"{prefix}: {self.message}"
 
 
+def partition_issues(
+    issues: list[ValidationIssue],
+) -> tuple[list[ValidationIssue], list[ValidationIssue], list[ValidationIssue]]:
+    """Split validation issues by severity in a single pass.
+
+    Args:
+        issues: Validation issues as returned by DiagramValidator.validate()
+
+    Returns:
+        Tuple of (errors, warnings, infos), each preserving the input order
+    """
+    error, warning = ValidationLevel.ERROR, ValidationLevel.WARNING
+    errors: list[ValidationIssue] = []
+    warnings: list[ValidationIssue] = []
+    infos: list[ValidationIssue] = []
+    for issue in issues:
+        level = issue.level
+        if level is error:
+            errors.append(issue)
+        elif level is warning:
+            warnings.append(issue)
+        else:
+            infos.append(issue)
+    return errors, warnings, infos
+
+
 class DiagramValidator:
     """Validates GPIO wiring diagrams for common mistakes.
 
@@ -217,9 +255,7 @@ class DiagramValidator:
         issues.extend(self._check_stub_wires(diagram, device_by_name))
 
         # Categorize for logging
-        errors = [i for i in issues if i.level == ValidationLevel.ERROR]
-        warnings = [i for i in issues if i.level == ValidationLevel.WARNING]
-        infos = [i for i in issues if i.level == ValidationLevel.INFO]
+        errors, warnings, infos = partition_issues(issues)
 
         log.info(
             "validation_completed",
@@ -247,6 +283,7 @@ class DiagramValidator:
         issues: list[ValidationIssue] = []
         pin_usage: dict[int, list[str]] = {}
         has_device_to_device = False
+        bus_devices: set[str] | None = None  # computed on first shared power/ground pin
 
         # Track board-to-device connections and check for device-to-device connections in one pass
         for conn in diagram.connections:
@@ -292,26 +329,11 @@ class DiagramValidator:
                         elif len(devices) > 1:
                             # Check if all these devices are on I2C or SPI bus
                             # If so, power sharing is expected and normal
-                            devices_on_shared_bus = True
-                            for dev_pin_ref in devices:
-                                dev_name = dev_pin_ref.split(".")[0]
-                                # Check if this device has any I2C/SPI connections
-                                has_bus_connection = False
-                                for c in diagram.connections:
-                                    if c.device_name == dev_name and c.board_pin:
-                                        bp = diagram.board.get_pin_by_number(c.board_pin)
-                                        if bp and bp.role in (
-                                            PinRole.I2C_SDA,
-                                            PinRole.I2C_SCL,
-                                            PinRole.SPI_MOSI,
-                                            PinRole.SPI_MISO,
-                                            PinRole.SPI_SCLK,
-                                        ):
-                                            has_bus_connection = True
-                                            break
-                                if not has_bus_connection:
-                                    devices_on_shared_bus = False
-                                    break
+                            if bus_devices is None:
+                                bus_devices = self._bus_connected_devices(diagram)
+                            devices_on_shared_bus = all(
+                                dev_pin_ref.split(".")[0] in bus_devices for dev_pin_ref in devices
+                            )
 
                             # Only warn if devices are NOT all on shared buses
                             if not devices_on_shared_bus:
@@ -371,6 +393,22 @@ class DiagramValidator:
 
         return issues
 
+    def _bus_connected_devices(self, diagram: Diagram) -> set[str]:
+        """Return names of devices wired to at least one I2C or SPI board pin.
+
+        Built in one pass over the connections so shared power/ground checks
+        don't rescan every connection for each device on the pin.
+        """
+        # First pin wins for a repeated number, matching Board.get_pin_by_number()
+        role_by_number: dict[int, PinRole] = {}
+        for pin in diagram.board.pins:
+            role_by_number.setdefault(pin.number, pin.role)
+        return {
+            conn.device_name
+            for conn in diagram.connections
+            if conn.board_pin and role_by_number.get(conn.board_pin) in _SHARED_BUS_ROLES
+        }
+
     def _check_voltage_mismatches(
         self, diagram: Diagram, device_by_name: dict[str, "Device"]
     ) -> list[ValidationIssue]:
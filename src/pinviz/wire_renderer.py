@@ -5,7 +5,7 @@ import math
 import drawsvg as draw
 
 from .layout import LayoutConfig, RoutedWire, create_bezier_path
-from .model import DEFAULT_COLORS, ComponentType, PinRole, Point
+from .model import DEFAULT_COLORS, ComponentType, PinRole, Point, WireColor
 from .render_constants import RENDER_CONSTANTS
 from .theme import ColorScheme
 
@@ -61,12 +61,28 @@ def get_halo_color(wire_color: str) -> str:
     Returns:
         Halo color as hex string ("#2C2C2C" for dark halo, "white" for light halo)
     """
+    halo_color = _PALETTE_HALO_COLORS.get(wire_color)
+    if halo_color is not None:
+        return halo_color
+    return _halo_color_for(wire_color)
+
+
+def _halo_color_for(wire_color: str) -> str:
+    """Pick the halo color for a wire color from its luminance."""
     luminance = calculate_luminance(wire_color)
     if luminance > RENDER_CONSTANTS.LUMINANCE_THRESHOLD:
         return RENDER_CONSTANTS.DARK_HALO_COLOR
     return RENDER_CONSTANTS.LIGHT_HALO_COLOR
 
 
+# Halo colors for the built-in palettes (named wire colors and role defaults),
+# computed once at import; nearly every wire uses one of these
+_PALETTE_HALO_COLORS: dict[str, str] = {
+    color: _halo_color_for(color)
+    for color in (*(c.value for c in WireColor), *DEFAULT_COLORS.values())
+}
+
+
 class WireRenderer:
     """Handles rendering of wires, inline components, and wire legends."""
 
@@ -201,6 +201,37 @@ def test_load_board_config_missing_file():
     assert "Board configuration file not found" in str(exc_info.value)
 
 
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ('{"name": "Broken",', "Invalid JSON in board configuration file"),
+        ('{"name": "Broken"}', "Invalid board configuration in"),
+    ],
+)
+def test_load_board_config_invalid_file(tmp_path, monkeypatch, content, message):
+    """Test that malformed and schema-invalid configs raise ValueError."""
+    config_path = tmp_path / "broken_board.json"
+    config_path.write_text(content)
+    monkeypatch.setattr(boards, "_get_board_config_path", lambda _name: config_path)
+    boards._load_board_config.cache_clear()
+
+    with pytest.raises(ValueError, match=message):
+        boards.load_board_from_config("broken_board")
+
+
+def test_load_board_from_config_returns_independent_boards():
+    """Test that repeated loads share the parsed config but not Board instances."""
+    first = boards.load_board_from_config("raspberry_pi_5")
+    second = boards.load_board_from_config("raspberry_pi_5")
+
+    assert first is not second
+    assert first.pins[0] is not second.pins[0]
+    assert first == second
+
+    first.pins.clear()
+    assert len(boards.load_board_from_config("raspberry_pi_5").pins) == 40
+
+
 def test_load_board_config_positions_calculated():
     """Test that pin positions are calculated from layout parameters."""
     board = boards.load_board_from_config("raspberry_pi_5")
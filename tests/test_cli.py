@@ -49,7 +49,7 @@ def test_main_with_no_args_shows_help():
 def test_main_with_render_command(sample_yaml_config, temp_output_dir):
     """Test main with render command."""
     output_file = temp_output_dir / "test_output.svg"
-    with patch("pinviz.cli.commands.render.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -63,7 +63,7 @@ def test_main_with_render_command(sample_yaml_config, temp_output_dir):
 def test_main_with_example_command(temp_output_dir):
     """Test main with example command."""
     output_file = temp_output_dir / "bh1750.svg"
-    with patch("pinviz.cli.commands.example.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -85,7 +85,7 @@ def test_main_with_list_command(capsys):
 def test_render_command_success(sample_yaml_config, temp_output_dir):
     """Test successful render command."""
     output_file = temp_output_dir / "test.svg"
-    with patch("pinviz.cli.commands.render.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -98,7 +98,7 @@ def test_render_command_success(sample_yaml_config, temp_output_dir):
 
 def test_render_command_default_output(sample_yaml_config):
     """Test render command with default output path."""
-    with patch("pinviz.cli.commands.render.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -117,7 +117,7 @@ def test_render_command_default_output(sample_yaml_config):
 def test_render_command_creates_output_directory(sample_yaml_config, temp_output_dir):
     """Test that render command creates output directory if needed."""
     nested_output = temp_output_dir / "nested" / "dir" / "output.svg"
-    with patch("pinviz.cli.commands.render.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -140,7 +140,7 @@ def test_render_command_file_not_found():
 
 def test_render_command_handles_exception(sample_yaml_config):
     """Test that render command handles exceptions gracefully."""
-    with patch("pinviz.cli.commands.render.load_diagram") as mock_load:
+    with patch("pinviz.config_loader.load_diagram") as mock_load:
         mock_load.side_effect = Exception("Test error")
         result = runner.invoke(
             app,
@@ -153,7 +153,7 @@ def test_render_command_handles_exception(sample_yaml_config):
 def test_example_command_bh1750(temp_output_dir):
     """Test example command with bh1750."""
     output_file = temp_output_dir / "bh1750.svg"
-    with patch("pinviz.cli.commands.example.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -167,7 +167,7 @@ def test_example_command_bh1750(temp_output_dir):
 def test_example_command_ir_led(temp_output_dir):
     """Test example command with ir_led."""
     output_file = temp_output_dir / "ir_led.svg"
-    with patch("pinviz.cli.commands.example.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -181,7 +181,7 @@ def test_example_command_ir_led(temp_output_dir):
 def test_example_command_i2c_spi(temp_output_dir):
     """Test example command with i2c_spi."""
     output_file = temp_output_dir / "i2c_spi.svg"
-    with patch("pinviz.cli.commands.example.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -194,7 +194,7 @@ def test_example_command_i2c_spi(temp_output_dir):
 
 def test_example_command_default_output():
     """Test example command with default output path."""
-    with patch("pinviz.cli.commands.example.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -285,6 +285,34 @@ def test_create_i2c_spi_example():
     assert len(diagram.connections) == 12
 
 
+def test_builtin_examples_validate_cleanly():
+    """Built-in examples must have no validation errors or warnings."""
+    from pinviz.cli.commands.example import EXAMPLE_REGISTRY
+    from pinviz.validation import DiagramValidator, partition_issues
+
+    for name, factory in EXAMPLE_REGISTRY.items():
+        errors, warnings, _ = partition_issues(DiagramValidator().validate(factory()))
+        assert not errors, name
+        assert not warnings, name
+
+
+def test_example_command_validates_each_example_once(temp_output_dir):
+    """Repeated runs of a clean example skip the validator."""
+    output_file = temp_output_dir / "bh1750.svg"
+    with (
+        patch("pinviz.cli.commands.example._VALIDATED_EXAMPLES", set()),
+        patch("pinviz.render_svg.SVGRenderer"),
+        patch(
+            "pinviz.cli.commands.example.DiagramValidator",
+            return_value=Mock(validate=Mock(return_value=[])),
+        ) as mock_validator,
+    ):
+        for _ in range(2):
+            result = runner.invoke(app, ["example", "bh1750", "-o", str(output_file)])
+            assert result.exit_code == 0
+    mock_validator.assert_called_once()
+
+
 def test_full_render_workflow(sample_yaml_config, temp_output_dir):
     """Test complete render workflow from config to SVG."""
     output_file = temp_output_dir / "workflow_test.svg"
@@ -358,6 +386,32 @@ def test_render_with_json_output(sample_yaml_config, temp_output_dir):
     assert output_file.exists()
 
 
+def test_progress_indicator_disabled_does_not_start_live_display():
+    """A disabled progress indicator (used for --json) never starts Rich's live display."""
+    from rich.console import Console
+
+    from pinviz.cli.decorators import progress_indicator
+
+    with progress_indicator(Console(force_terminal=True), "", disable=True) as progress:
+        progress.add_task("Rendering SVG...", total=None)
+        assert not progress.live.is_started
+
+
+def test_progress_indicator_skips_live_display_when_not_a_terminal():
+    """Captured or piped output gets no live spinner display."""
+    from io import StringIO
+
+    from rich.console import Console
+
+    from pinviz.cli.decorators import progress_indicator
+
+    buffer = StringIO()
+    with progress_indicator(Console(file=buffer), "") as progress:
+        progress.add_task("Rendering SVG...", total=None)
+        assert not progress.live.is_started
+    assert buffer.getvalue() == ""
+
+
 def test_render_json_output_is_machine_readable_on_error(temp_output_dir):
     """Render --json should emit JSON only, even on config errors."""
     import json
@@ -534,6 +588,28 @@ def test_validation_result_json_output_with_issues():
     assert "warning" in output_str.lower()
 
 
+def test_output_json_plain_path_matches_rich_print_json():
+    """Non-terminal JSON output is identical to Rich's print_json()."""
+    from io import StringIO
+
+    from rich.console import Console
+
+    from pinviz.cli.output import ValidateOutputJson, ValidationSummary, output_json
+
+    data = ValidateOutputJson(
+        status="warning",
+        validation=ValidationSummary(errors=0, warnings=1),
+        issues=[{"level": "WARNING", "message": '5V → 3V3 "check" wiring'}],
+    )
+
+    expected = StringIO()
+    Console(file=expected).print_json(data=data.model_dump(mode="json", exclude_none=True))
+    for payload in (data, data.model_dump(mode="json", exclude_none=True)):
+        actual = StringIO()
+        output_json(payload, Console(file=actual))
+        assert actual.getvalue() == expected.getvalue()
+
+
 def test_validate_command_show_graph(sample_yaml_config):
     """Test validate command with --show-graph flag."""
     result = runner.invoke(
@@ -598,7 +674,7 @@ def test_validate_json_output_is_machine_readable_on_error(temp_output_dir):
 def test_render_command_with_theme_light(sample_yaml_config, temp_output_dir):
     """Test render command with --theme light flag."""
     output_file = temp_output_dir / "test_light.svg"
-    with patch("pinviz.cli.commands.render.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -618,7 +694,7 @@ def test_render_command_with_theme_light(sample_yaml_config, temp_output_dir):
 def test_render_command_with_theme_dark(sample_yaml_config, temp_output_dir):
     """Test render command with --theme dark flag."""
     output_file = temp_output_dir / "test_dark.svg"
-    with patch("pinviz.cli.commands.render.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -649,7 +725,7 @@ def test_render_command_with_invalid_theme(sample_yaml_config, temp_output_dir):
 def test_example_command_with_theme_light(temp_output_dir):
     """Test example command with --theme light flag."""
     output_file = temp_output_dir / "bh1750_light.svg"
-    with patch("pinviz.cli.commands.example.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -669,7 +745,7 @@ def test_example_command_with_theme_light(temp_output_dir):
 def test_example_command_with_theme_dark(temp_output_dir):
     """Test example command with --theme dark flag."""
     output_file = temp_output_dir / "bh1750_dark.svg"
-    with patch("pinviz.cli.commands.example.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -700,7 +776,7 @@ def test_example_command_with_invalid_theme(temp_output_dir):
 def test_render_command_with_visibility_flags_and_theme(sample_yaml_config, temp_output_dir):
     """Test render command with visibility flags combined with theme."""
     output_file = temp_output_dir / "test_flags.svg"
-    with patch("pinviz.cli.commands.render.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -733,7 +809,7 @@ def test_render_command_with_visibility_flags_and_theme(sample_yaml_config, temp
 def test_example_command_with_visibility_flags_and_theme(temp_output_dir):
     """Test example command with visibility flags combined with theme."""
     output_file = temp_output_dir / "bh1750_flags.svg"
-    with patch("pinviz.cli.commands.example.SVGRenderer") as mock_renderer:
+    with patch("pinviz.render_svg.SVGRenderer") as mock_renderer:
         mock_instance = Mock()
         mock_renderer.return_value = mock_instance
         result = runner.invoke(
@@ -76,6 +76,9 @@ def test_invalid_hex_formats():
     # Invalid characters
     assert resolve_color("#GGGGGG") == "#4A90E2"
     assert resolve_color("#FF00GG") == "#4A90E2"
+    # Characters int(..., 16) would tolerate
+    assert resolve_color("#+FFFFF") == "#4A90E2"
+    assert resolve_color("#FF_FFF") == "#4A90E2"
 
 
 def test_empty_string():
@@ -90,3 +93,10 @@ def test_whitespace_handling():
     assert resolve_color("\tgreen\n") == "#00FF00"
     assert resolve_color("  #FF0000  ") == "#FF0000"
     assert resolve_color(" BLUE ") == "#0000FF"
+
+
+def test_repeated_inputs_are_cached():
+    """Test that resolving the same color again is served from the cache."""
+    resolve_color.cache_clear()
+    assert resolve_color("purple") == resolve_color("purple")
+    assert resolve_color.cache_info().hits == 1
@@ -3,8 +3,9 @@
 import json
 
 import pytest
+import yaml
 
-from pinviz.config_loader import ConfigLoader, load_diagram
+from pinviz.config_loader import ConfigLoader, load_diagram, load_diagrams
 from pinviz.model import ComponentType, WireStyle
 
 
@@ -43,6 +44,28 @@ def test_load_from_unsupported_format(temp_output_dir):
         loader.load_from_file(config_path)
 
 
+def test_load_yaml_rejects_python_tags(temp_output_dir):
+    """Test that YAML configs are parsed with a safe loader."""
+    config_path = temp_output_dir / "unsafe.yaml"
+    config_path.write_text('title: !!python/object/apply:os.getcwd []\nboard: "rpi5"\n')
+
+    loader = ConfigLoader()
+    with pytest.raises(yaml.YAMLError):
+        loader.load_from_file(config_path)
+
+
+def test_load_diagrams_matches_load_diagram():
+    """Test that batch loading yields the same diagrams as loading one by one."""
+    paths = ["examples/bh1750.yaml", "examples/led_with_resistor.json"]
+
+    diagrams = list(load_diagrams(paths, emit_validation_output=False))
+
+    assert [d.title for d in diagrams] == [
+        load_diagram(path, emit_validation_output=False).title for path in paths
+    ]
+    assert all(d.connections for d in diagrams)
+
+
 def test_load_from_json_file(temp_output_dir):
     """Test loading a diagram from a JSON file."""
     config = {
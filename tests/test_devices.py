@@ -248,6 +248,16 @@ def test_registry_get_nonexistent_device():
     assert template is None
 
 
+def test_registry_group_by_category_matches_per_category_lists():
+    """Test that grouping by category agrees with list_by_category()."""
+    registry = get_registry()
+    grouped = registry.group_by_category()
+
+    assert list(grouped) == registry.get_categories()
+    for category, templates in grouped.items():
+        assert templates == registry.list_by_category(category)
+
+
 def test_registry_create_device():
     """Test creating a device from the registry."""
     registry = get_registry()
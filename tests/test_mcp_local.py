@@ -150,6 +150,57 @@ def test_generate_diagram_includes_validation():
     assert "validation_status" in result
 
 
+def test_generate_diagram_dict_format_loads_without_yaml():
+    """output_format='dict' should return a config loadable without YAML parsing."""
+    import json
+
+    from pinviz.config_loader import load_diagram_from_dict
+    from pinviz.mcp.server import generate_diagram
+
+    result = json.loads(generate_diagram("Connect BME280 sensor", output_format="dict"))
+
+    assert result["status"] == "success"
+    assert "yaml_content" not in result
+    config = result["diagram"]
+    assert config["connections"]
+
+    diagram = load_diagram_from_dict(config, emit_validation_output=False)
+    assert diagram.title == result["title"]
+    assert len(diagram.connections) == len(config["connections"])
+
+
+def test_yaml_emitter_round_trips_special_characters():
+    """Names containing quotes, colons or backslashes must survive a YAML load."""
+    import yaml
+
+    from pinviz.mcp.yaml_emitter import dump_diagram_config
+
+    config = {
+        "title": 'Sensor "A": test',
+        "board": "raspberry_pi_5",
+        "devices": [
+            {"name": "Temp\\Probe", "pins": [{"name": "VCC", "role": "3V3"}]},
+            {"name": "LED #1"},
+        ],
+        "connections": [{"board_pin": 1, "device": "Temp\\Probe", "device_pin": "VCC"}],
+    }
+
+    assert yaml.safe_load(dump_diagram_config(config)) == config
+
+
+def test_generate_diagram_reuses_cached_response():
+    """Repeated prompts should be answered from the response cache."""
+    from pinviz.mcp.server import _generate_diagram_response, generate_diagram
+
+    _generate_diagram_response.cache_clear()
+
+    first = generate_diagram("Connect BME280 sensor", output_format="summary")
+    second = generate_diagram("Connect BME280 sensor", output_format="summary")
+
+    assert first == second
+    assert _generate_diagram_response.cache_info().hits == 1
+
+
 def main():
     """Run all MCP local tests manually."""
     print("=" * 70)
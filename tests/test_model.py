@@ -1,5 +1,7 @@
 """Tests for the core data model."""
 
+import dataclasses
+
 import pytest
 
 from pinviz.model import (
@@ -77,6 +79,15 @@ def test_point_equality():
     assert p1 != p3
 
 
+def test_point_is_hashable_and_immutable():
+    """Test that Point is a frozen, slotted value type."""
+    p = Point(10, 20)
+    assert len({p, Point(10, 20)}) == 1
+    assert not hasattr(p, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        p.x = 5
+
+
 def test_header_pin_creation():
     """Test creating a HeaderPin."""
     pin = HeaderPin(
@@ -249,6 +260,14 @@ def test_connection_with_net_name():
     assert conn.net_name == "VCC_3V3"
 
 
+def test_connection_is_immutable():
+    """Test that Connection fields cannot be reassigned after validation."""
+    conn = Connection(board_pin=1, device_name="Device1", device_pin_name="VCC")
+    assert not hasattr(conn, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        conn.board_pin = 2
+
+
 def test_board_connection_creation():
     """Test creating board-to-device connection."""
     conn = Connection(board_pin=1, device_name="LED", device_pin_name="VCC")
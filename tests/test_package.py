@@ -0,0 +1,40 @@
+"""Tests for the top-level pinviz package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pinviz
+
+
+def test_public_names_resolve():
+    """Every name in __all__ should be importable from the package."""
+    for name in pinviz.__all__:
+        assert getattr(pinviz, name) is not None
+
+
+def test_dir_lists_lazy_names():
+    """dir(pinviz) should include the lazily imported public API."""
+    assert set(pinviz.__all__) <= set(dir(pinviz))
+
+
+def test_unknown_attribute_raises():
+    """Unknown attributes should still raise AttributeError."""
+    with pytest.raises(AttributeError, match="does_not_exist"):
+        _ = pinviz.does_not_exist
+
+
+def test_import_does_not_load_renderer():
+    """Importing pinviz alone should not import the SVG renderer."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pinviz; print('pinviz.render_svg' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -379,6 +379,41 @@ def test_render_overwrites_existing_file(sample_diagram, temp_output_dir):
     assert sample_diagram.title in content
 
 
+def test_render_to_string_matches_file_output(sample_diagram, temp_output_dir):
+    """Test that render_to_string returns the same document render writes."""
+    output_path = temp_output_dir / "to_string.svg"
+    renderer = SVGRenderer()
+
+    renderer.render(sample_diagram, output_path)
+    svg_string = renderer.render_to_string(sample_diagram)
+
+    assert svg_string == output_path.read_text(encoding="utf-8")
+    assert svg_string.startswith("<?xml")
+
+
+def test_cached_board_layer_matches_fresh_render(monkeypatch):
+    """Test that splicing the cached board layer yields the same SVG as inlining it."""
+    from unittest.mock import patch
+
+    monkeypatch.setattr(SVGRenderer, "_static_board_cache", {})
+    diagram = Diagram(
+        title="Cache Test",
+        board=boards.raspberry_pi_5(),
+        devices=[get_registry().create("bh1750")],
+        connections=[Connection(1, "BH1750 Light Sensor", "VCC")],
+    )
+    renderer = SVGRenderer()
+
+    fresh = renderer.render_to_string(diagram)
+    assert len(SVGRenderer._static_board_cache) == 1
+
+    # The asset must not be parsed again once its layer is cached
+    with patch("xml.etree.ElementTree.parse", side_effect=AssertionError("parsed again")):
+        cached = renderer.render_to_string(diagram)
+
+    assert cached == fresh
+
+
 def test_render_handles_missing_svg_asset(sample_diagram, temp_output_dir):
     """Test that render handles missing SVG asset file gracefully."""
     from unittest.mock import patch
@@ -3,7 +3,13 @@
 from pinviz import boards
 from pinviz.devices import get_registry
 from pinviz.model import Connection, Device, DevicePin, Diagram, PinRole, Point
-from pinviz.validation import DiagramValidator, ValidationLevel, check_pin_compatibility
+from pinviz.validation import (
+    DiagramValidator,
+    ValidationIssue,
+    ValidationLevel,
+    check_pin_compatibility,
+    partition_issues,
+)
 
 
 class TestDuplicatePinDetection:
@@ -71,6 +77,33 @@ class TestDuplicatePinDetection:
         errors = [i for i in issues if i.level == ValidationLevel.ERROR]
         assert len(errors) == 0
 
+    def test_shared_ground_warns_unless_all_devices_on_bus(self):
+        """Test that sharing ground warns when a device sharing it is not on I2C/SPI."""
+        board = boards.raspberry_pi_5()
+        sensor = get_registry().create("bh1750")
+        button = get_registry().create("button")
+
+        connections = [
+            Connection(1, "BH1750 Light Sensor", "VCC"),
+            Connection(6, "BH1750 Light Sensor", "GND"),
+            Connection(3, "BH1750 Light Sensor", "SDA"),
+            Connection(5, "BH1750 Light Sensor", "SCL"),
+            Connection(11, button.name, "SIG"),
+            Connection(6, button.name, "GND"),
+        ]
+
+        diagram = Diagram(
+            title="Test",
+            board=board,
+            devices=[sensor, button],
+            connections=connections,
+        )
+
+        issues = DiagramValidator().validate(diagram)
+
+        warnings = [i for i in issues if i.level == ValidationLevel.WARNING]
+        assert any("share" in w.message and w.location == "Pin 6" for w in warnings)
+
     def test_shared_i2c_pins_noted(self):
         """Test that shared I2C pins are noted (not an error)."""
         board = boards.raspberry_pi_5()
@@ -387,6 +420,30 @@ class TestValidDiagrams:
         assert len(errors) == 0
 
 
+class TestPartitionIssues:
+    """Tests for splitting validation issues by severity."""
+
+    def test_partition_preserves_order_within_levels(self):
+        """Test that issues are split by level in their original order."""
+        issues = [
+            ValidationIssue(ValidationLevel.WARNING, "w1"),
+            ValidationIssue(ValidationLevel.ERROR, "e1"),
+            ValidationIssue(ValidationLevel.INFO, "i1"),
+            ValidationIssue(ValidationLevel.ERROR, "e2"),
+            ValidationIssue(ValidationLevel.WARNING, "w2"),
+        ]
+
+        errors, warnings, infos = partition_issues(issues)
+
+        assert [i.message for i in errors] == ["e1", "e2"]
+        assert [i.message for i in warnings] == ["w1", "w2"]
+        assert [i.message for i in infos] == ["i1"]
+
+    def test_partition_empty(self):
+        """Test that an empty issue list yields three empty lists."""
+        assert partition_issues([]) == ([], [], [])
+
+
 class TestPinCompatibilityMatrix:
     """Tests for the pin compatibility matrix function."""
 
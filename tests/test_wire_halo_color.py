@@ -2,6 +2,7 @@
 
 import pytest
 
+from pinviz.model import WireColor
 from pinviz.render_constants import RENDER_CONSTANTS
 from pinviz.wire_renderer import calculate_luminance, get_halo_color
 
@@ -110,6 +111,16 @@ class TestHaloColorSelection:
         if calculate_luminance(medium_gray) < threshold:
             assert get_halo_color(medium_gray) == RENDER_CONSTANTS.LIGHT_HALO_COLOR
 
+    @pytest.mark.parametrize("wire_color", list(WireColor))
+    def test_palette_colors_match_luminance_rule(self, wire_color):
+        """Precomputed halos for named colors must agree with the luminance rule."""
+        expected = (
+            RENDER_CONSTANTS.DARK_HALO_COLOR
+            if calculate_luminance(wire_color.value) > RENDER_CONSTANTS.LUMINANCE_THRESHOLD
+            else RENDER_CONSTANTS.LIGHT_HALO_COLOR
+        )
+        assert get_halo_color(wire_color.value) == expected
+
 
 class TestLuminanceAccuracy:
     """Test luminance calculation accuracy using known WCAG values."""